@@ -6,22 +6,77 @@
    typeclasses
    types
 
+The public names of the submodules (their ``__all__``) are available in the
+top-level namespace. The submodules are imported only when one of their names
+is first accessed (see PEP 562), so, for instance, ``from haskpy import map``
+doesn't import the types or the optics. ``from haskpy import *`` doesn't
+include ``any`` and ``all`` so that the builtins aren't shadowed.
+
 """
 
-from .functions import *
-from .utils import *
-from .typeclasses import *
-from .types import *
-from .optics import *
-from . import autoclass
-
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ModuleNotFoundError:
-    from importlib_metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:
-    # package is not installed
-    pass
+from importlib import import_module as _import_module
+
+
+# Submodules whose public names (their __all__) are available in this
+# namespace. A name is searched from the submodules in this order, importing
+# them one by one until the name is found.
+_submodules = ("functions", "utils", "typeclasses", "types", "optics")
+
+# Functions that would shadow the builtins of the same name aren't included in
+# ``from haskpy import *`` but they are available as attributes (e.g.,
+# ``haskpy.any``).
+_shadowing = frozenset({"any", "all"})
+
+
+def _import(submodule):
+    return _import_module("." + submodule, __name__)
+
+
+def _names():
+    """All the names of the submodules, imports all the submodules"""
+    return {
+        name
+        for submodule in _submodules
+        for name in _import(submodule).__all__
+    }
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return _import(name)
+    if name == "__version__":
+        return _version()
+    if name == "__all__":
+        value = sorted(_names() - _shadowing)
+    else:
+        for submodule in _submodules:
+            module = _import(submodule)
+            if name in module.__all__:
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(__name__, name)
+            )
+    # Next time the name is found without calling this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | _names())
+
+
+def _version():
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ModuleNotFoundError:
+        from importlib_metadata import version, PackageNotFoundError
+
+    try:
+        return version(__name__)
+    except PackageNotFoundError:
+        # package is not installed
+        raise AttributeError(
+            "module {0!r} has no attribute '__version__'".format(__name__)
+        ) from None
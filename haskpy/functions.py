@@ -1,20 +1,65 @@
 import attr
-import functools
+import collections
 import inspect
-from hypothesis import strategies as st
+import types
 
 from haskpy.typeclasses import Monad, Monoid, Cartesian, Cocartesian, Semigroup
 from haskpy.utils import (
+    st,
     curry,
     identity,
     immutable,
+    Wrapped,
+    wraps,
+    getfullargspec,
     class_property,
     class_function,
     eq_test,
+    type_constructor,
 )
 from haskpy import testing
 
 
+__all__ = [
+    "CacheInfo",
+    "Function",
+    "FunctionMonoid",
+    "all",
+    "any",
+    "append",
+    "apply",
+    "bind",
+    "compose",
+    "const",
+    "contramap",
+    "contrareplace",
+    "dimap",
+    "either",
+    "elem",
+    "find",
+    "fold",
+    "fold_map",
+    "fold_until",
+    "foldl",
+    "foldr",
+    "foldr_lazy",
+    "function",
+    "join",
+    "length",
+    "liftA2",
+    "liftA3",
+    "map",
+    "match",
+    "mconcat",
+    "memoize",
+    "null",
+    "replace",
+    "sequence",
+    "sum",
+]
+
+
+@type_constructor
 def FunctionMonoid(monoid):
     """Create a function type that has a Monoid instance"""
 
@@ -34,6 +79,42 @@ def FunctionMonoid(monoid):
     return _FunctionMonoid
 
 
+@immutable
+class _Pipeline():
+    # Composition of one-argument functions as a flat tuple of stages. The
+    # stages are called in order in a loop, so a long chain of compositions
+    # doesn't create nested Python frames and doesn't hit the recursion limit.
+    # Composing pipelines concatenates their stages instead of nesting them.
+
+    stages = attr.ib(converter=tuple)
+
+    def __call__(self, x):
+        for f in self.stages:
+            x = f(x)
+            # Wrap callable results similarly as Function.__call__ does, so
+            # the next stage gets them as Functions
+            if callable(x) and not isinstance(x, Function):
+                x = Function(x)
+        return x
+
+    def __repr__(self):
+        return "Pipeline({})".format(", ".join(repr(f) for f in self.stages))
+
+
+def _stages(f):
+    """Return the stages of a function as a tuple for composing pipelines"""
+    return f._stages() if isinstance(f, Function) else (f,)
+
+
+def _pipe(*fs):
+    """Compose one-argument functions from first to last as a flat pipeline"""
+    return Function(_Pipeline(
+        stage
+        for f in fs
+        for stage in _stages(f)
+    ))
+
+
 @immutable
 class Function(Monad, Cartesian, Cocartesian, Semigroup):
     """Monad instance for functions
@@ -66,15 +147,15 @@ class Function(Monad, Cartesian, Cocartesian, Semigroup):
 
     def dimap(f, g, h):
         """(b -> c) -> (a -> b) -> (c -> d) -> (a -> d)"""
-        return Function(lambda x: h(f(g(x))))
+        return _pipe(g, f, h)
 
     def map(f, g):
         """(a -> b) -> (b -> c) -> (a -> c)"""
-        return Function(lambda x: g(f(x)))
+        return _pipe(f, g)
 
     def contramap(f, g):
         """(b -> c) -> (a -> b) -> (a -> c)"""
-        return Function(lambda a: f(g(a)))
+        return _pipe(g, f)
 
     def apply(f, g):
         """(a -> b) -> (a -> b -> c) -> a -> c"""
@@ -130,6 +211,15 @@ class Function(Monad, Cartesian, Cocartesian, Semigroup):
     def __repr__(self):
         return repr(self.__f)
 
+    def _stages(self):
+        # Compositions are stored as flat pipelines. The stages of other
+        # functions are the underlying raw functions so calling the pipeline
+        # doesn't go through Function.__call__ at each stage.
+        return (
+            self.__f.stages if isinstance(self.__f, _Pipeline) else
+            (self.__f,)
+        )
+
     @property
     def __module__(self):
         return self.__f.__module__
@@ -151,22 +241,29 @@ class Function(Monad, Cartesian, Cocartesian, Semigroup):
 
         See: https://stackoverflow.com/a/3296318
 
+        The underlying function is bound as a built-in method object. That's
+        cheaper than creating a partial object and copying the docstring, and
+        calling it skips the extra call of ``Function.__call__``. Bound methods
+        aren't cached in the instances, so the instances stay picklable and
+        don't get reference cycles through their methods.
+
         """
-        if obj is not None:
-            # Instance method, bind the first argument
-            fp = functools.partial(self, obj)
-            # Keep the docstring untouched
-            fp.__doc__ = self.__doc__
-            return Function(fp)
-        else:
+        if obj is None:
             # Class method
             return self
+        # Instance method, bind the first argument. The method object gives
+        # the docstring of the function.
+        return Function(types.MethodType(self.__f, obj))
 
-    def __eq_test__(self, g, data, input_strategy=st.integers()):
+    def __eq_test__(self, g, data, input_strategy=None):
         # NOTE: This is used only in tests when the function input doesn't
         # really matter so any hashable type here is ok. The type doesn't
         # matter because the functions are either _TestFunction or created with
         # pure.
+        # The default strategy is created here so that Hypothesis isn't
+        # imported with HaskPy
+        if input_strategy is None:
+            input_strategy = st.integers()
         x = data.draw(input_strategy)
         return eq_test(self(x), g(x), data)
 
@@ -185,6 +282,197 @@ def function(f):
     return Function(curry(f))
 
 
+@immutable
+class _RawFunction(Function):
+    # Function which doesn't wrap the results of calls.
+    #
+    # Function wraps callable results in Function, which costs an extra
+    # allocation and type checks at each call. The library's own combinators
+    # don't need that: their results are returned as they are. Only partial
+    # applications are kept as raw functions so that they still have the
+    # methods of Function.
+
+    # The class body would otherwise hide the properties of Function that give
+    # the docstring and module of the wrapped function
+    __doc__ = Function.__dict__["__doc__"]
+    __module__ = Function.__dict__["__module__"]
+
+    def __call__(self, *args, **kwargs):
+        y = self._Function__f(*args, **kwargs)
+        return _RawFunction(y) if type(y) is Wrapped else y
+
+
+def _raw_function(f):
+    """Decorator similar to ``function`` but results aren't wrapped"""
+    return _RawFunction(curry(f))
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize"],
+)
+
+
+class _KeyToken():
+    """Placeholder key in the LRU order for an unhashable argument tuple"""
+    __slots__ = ()
+
+
+# Separator between positional and keyword arguments in cache keys
+_kwargs_mark = object()
+
+
+class _LRUCache():
+    """Least-recently-used cache of function results
+
+    Hashable argument tuples are looked up from a dictionary. Unhashable ones
+    are found by comparing equality against the list of unhashable keys, and
+    a token represents them in the dictionary. Thus, the dictionary keeps the
+    LRU order of all the results.
+
+    """
+
+    def __init__(self, f, maxsize, typed):
+        self.f = f
+        self.maxsize = maxsize
+        self.typed = typed
+        self.clear()
+        return
+
+    def clear(self):
+        self.results = collections.OrderedDict()
+        self.unhashable = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        return
+
+    def info(self):
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            currsize=len(self.results),
+        )
+
+    def key(self, args, kwargs):
+        key = args
+        if kwargs:
+            key += (_kwargs_mark,) + tuple(kwargs.items())
+        if self.typed:
+            key += tuple(type(v) for v in args)
+            if kwargs:
+                key += tuple(type(v) for v in kwargs.values())
+        return key
+
+    def find_unhashable(self, key):
+        for (other, token) in self.unhashable:
+            try:
+                if other == key:
+                    return token
+            except TypeError:
+                # Values without Eq instance can't be compared
+                pass
+        return None
+
+    def __call__(self, *args, **kwargs):
+        key = self.key(args, kwargs)
+        unhashable = None
+        try:
+            hash(key)
+        except TypeError:
+            # None if the key hasn't been cached
+            unhashable = key
+            key = self.find_unhashable(key)
+
+        if key is not None:
+            try:
+                y = self.results[key]
+            except KeyError:
+                pass
+            else:
+                self.hits += 1
+                self.results.move_to_end(key)
+                return y
+
+        self.misses += 1
+        y = self.f(*args, **kwargs)
+        if self.maxsize is None or self.maxsize > 0:
+            # Register a new unhashable key only after the function has
+            # returned, so failing calls don't leave tokens behind
+            if key is None:
+                key = _KeyToken()
+                self.unhashable.append((unhashable, key))
+            self.results[key] = y
+            if self.maxsize is not None and len(self.results) > self.maxsize:
+                self.evict()
+        return y
+
+    def evict(self):
+        (key, _) = self.results.popitem(last=False)
+        if isinstance(key, _KeyToken):
+            self.unhashable = [
+                (other, token) for (other, token) in self.unhashable
+                if token is not key
+            ]
+        self.evictions += 1
+        return
+
+
+@immutable
+class _MemoizedFunction(Function):
+    # Function with cached results, see memoize
+
+    # Docstring and module of the wrapped function as in _RawFunction
+    __doc__ = Function.__dict__["__doc__"]
+    __module__ = Function.__dict__["__module__"]
+
+    __cache = attr.ib()
+
+    def cache_info(self):
+        """Return the cache statistics as a named tuple
+
+        The fields are ``hits``, ``misses``, ``evictions``, ``maxsize`` and
+        ``currsize``.
+
+        """
+        return self.__cache.info()
+
+    def cache_clear(self):
+        """Clear the cache and the statistics"""
+        self.__cache.clear()
+        return
+
+
+def memoize(f, maxsize=128, typed=False):
+    """Curried function that caches its results
+
+    The results are cached for the full argument tuple, so partial
+    applications of the curried function don't touch the cache. Hashable
+    arguments are looked up from a hash table and unhashable ones by comparing
+    equality. When ``maxsize`` results have been cached, the least recently
+    used one is evicted. ``maxsize=None`` means that the cache can grow
+    without bound. If ``typed`` is true, arguments of different types are
+    cached separately (e.g., ``1`` and ``1.0``).
+
+    The returned function has methods ``cache_info`` and ``cache_clear`` for
+    inspecting the hits, misses and evictions and for clearing the cache.
+
+    """
+    cache = _LRUCache(f, maxsize=maxsize, typed=typed)
+    # Check the arguments before calling so partial applications never reach
+    # the cache
+    return _MemoizedFunction(
+        curry(
+            wraps(f)(cache),
+            argspec=getfullargspec(f),
+            checked=True,
+        ),
+        cache,
+    )
+
+
 @function
 def compose(g, f):
     # Problem with composing with *args and **kwargs as:
@@ -207,8 +495,9 @@ def compose(g, f):
     #
     #   h(2, 3)
     #
-    # Thus, let's use exactly one argument:
-    return Function(lambda x: g(f(x)))
+    # Thus, let's use exactly one argument. The composition is a flat
+    # pipeline of stages so that long chains don't nest function calls:
+    return _pipe(f, g)
 
 
 @function
@@ -217,13 +506,13 @@ def const(x, y):
     return x
 
 
-@function
+@_raw_function
 def _cross(f, g, ab):
     """(a -> c) -> (b -> d) -> (a, b) -> (c, d)"""
     return (f(ab[0]), g(ab[1]))
 
 
-@function
+@_raw_function
 def _plus(f, g, eab):
     """(a -> c) -> (b -> d) -> Either a b -> Either c d"""
     # FIXME: Once Bifunctor has been implemented, just use:
@@ -258,14 +547,14 @@ def replace(a, x):
 # Applicative-related functions
 #
 
-@function
+@_raw_function
 def liftA2(f, x, y):
-    return x.map(f).apply(y)
+    return x.map(f).apply_to(y)
 
 
 @function
 def liftA3(f, x, y, z):
-    return liftA2(f, x, y).apply(z)
+    return liftA2(f, x, y).apply_to(z)
 
 
 @function
@@ -332,7 +621,7 @@ def append(x, y):
 # Foldable-related functions
 #
 
-@function
+@_raw_function
 def fold_map(monoid, f, xs):
     """(Foldable t, Monoid m) => Monoid -> (a -> m) -> t a -> m
 
@@ -344,6 +633,17 @@ def fold_map(monoid, f, xs):
     return xs.fold_map(monoid, f)
 
 
+@function
+def mconcat(monoid, xs):
+    """Monoid m => Monoid -> Iterable m -> m
+
+    The first argument is the class of the values so that empty iterables can
+    be handled.
+
+    """
+    return monoid.mconcat(xs)
+
+
 @function
 def foldl(combine, initial, xs):
     """Foldable t => (b -> a -> b) -> b -> t a -> b"""
@@ -356,6 +656,36 @@ def foldr(combine, initial, xs):
     return xs.foldr(combine, initial)
 
 
+@function
+def foldr_lazy(combine, initial, xs):
+    """Foldable t => (a -> Trampoline b -> Trampoline b) -> b -> t a -> b"""
+    return xs.foldr_lazy(combine, initial)
+
+
+@function
+def fold_until(combine, initial, xs):
+    """Foldable t => (b -> a -> Either c b) -> b -> t a -> Either c b"""
+    return xs.fold_until(combine, initial)
+
+
+@function
+def any(p, xs):
+    """Foldable t => (a -> Bool) -> t a -> Bool"""
+    return xs.any(p)
+
+
+@function
+def all(p, xs):
+    """Foldable t => (a -> Bool) -> t a -> Bool"""
+    return xs.all(p)
+
+
+@function
+def find(p, xs):
+    """Foldable t => (a -> Bool) -> t a -> Maybe a"""
+    return xs.find(p)
+
+
 @function
 def fold(monoid, xs):
     """(Foldable t, Monoid m) => Monoid -> t a -> m
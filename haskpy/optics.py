@@ -14,6 +14,13 @@ Resources:
 from haskpy.functions import function, identity, either
 
 
+__all__ = [
+    "adapter",
+    "lens",
+    "prism",
+]
+
+
 @function
 def adapter(receive, send):
     """(s -> a) -> (b -> t) -> AdapterP a b s t
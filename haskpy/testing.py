@@ -1,7 +1,6 @@
-import hypothesis.strategies as st
 import attr
 
-from haskpy.utils import singleton, immutable
+from haskpy.utils import singleton, immutable, st, composite
 
 
 def types():
@@ -71,7 +70,7 @@ def sample_eq_type():
     return sample_type_of(lambda cls: cls.sample_eq_type())
 
 
-@st.composite
+@composite
 def sample_function(draw, b):
     return memoize(lambda _: draw(b))
 
@@ -1,4 +1,4 @@
-from haskpy.functions import Function, FunctionMonoid
+from haskpy.functions import Function, FunctionMonoid, function
 from haskpy.conftest import make_test_class
 from haskpy.types.monoids import Sum
 
@@ -9,3 +9,485 @@ TestFunction = make_test_class(Function)
 # Testing the Monoid instance requires some Monoid type. Otherwise, only
 # Semigroup laws can be tested.
 TestFunctionMonoid = make_test_class(FunctionMonoid(Sum))
+
+
+def test_function_composition_pipeline():
+
+    from haskpy.functions import compose
+
+    inc = Function(lambda x: x + 1)
+
+    # Long chains of compositions are flattened and don't hit the recursion
+    # limit
+    f = inc
+    for _ in range(10000):
+        f = f.map(lambda x: x + 1)
+    assert f(0) == 10001
+    assert len(f._stages()) == 10001
+
+    g = inc
+    for _ in range(10000):
+        g = g.contramap(lambda x: 2 * x)
+    assert g(0) == 1
+
+    h = inc
+    for _ in range(10000):
+        h = compose(h, inc)
+    assert h(0) == 10001
+
+    # Composing pipelines concatenates their stages
+    fg = compose(f, compose(inc, f))
+    assert fg(0) == 20003
+    assert len(fg._stages()) == 20003
+
+    # Order of the stages
+    double = Function(lambda x: 2 * x)
+    assert inc.map(double)(3) == 8
+    assert inc.contramap(double)(3) == 7
+    assert inc.dimap(double, lambda x: -x)(3) == -7
+    assert compose(inc, double)(3) == 7
+
+    # Callable results of the stages are wrapped in Function, so the next
+    # stage can use the methods of Function
+    from haskpy.functions import function
+    add = Function(lambda x: lambda y: x + y)
+    assert add.map(lambda h: h.map(lambda z: 10 * z))(1)(2) == 30
+    curried_add = function(lambda x, y: x + y)
+    assert compose(lambda h: h.map(lambda z: 10 * z), curried_add)(1)(2) == 30
+
+    assert repr(Function(abs).map(str)) == (
+        "Pipeline(<built-in function abs>, <class 'str'>)"
+    )
+    return
+
+
+def benchmark_function_composition_pipeline():
+
+    import timeit
+    from haskpy.functions import compose
+
+    def nested(f, g):
+        # Function.map before flattening pipelines
+        return Function(lambda x: g(f(x)))
+
+    def run(name, g, number):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:12.2f} us".format(name, 1e6 * t))
+        return
+
+    inc = lambda x: x + 1
+
+    for n in [10, 100, 10000]:
+        f = Function(inc)
+        g = Function(inc)
+        for _ in range(n - 1):
+            f = f.map(inc)
+            g = compose(g, inc)
+        number = max(1, 100000 // n)
+        print("{0} stages".format(n))
+        if n < 1000:
+            h = Function(inc)
+            for _ in range(n - 1):
+                h = nested(h, inc)
+            run("  nested lambdas", lambda: h(0), number)
+        run("  Function.map pipeline", lambda: f(0), number)
+        run("  compose pipeline", lambda: g(0), number)
+
+    return
+
+
+def test_raw_function():
+
+    from haskpy.functions import _raw_function, _RawFunction
+
+    g = Function(lambda x: x + 1)
+
+    @_raw_function
+    def f(x, y, z):
+        """Docstring"""
+        return g
+
+    # Metainformation of the wrapped function is kept
+    assert f.__doc__ == "Docstring"
+    assert f.__module__ == __name__
+
+    # Partial applications are kept as Functions
+    assert isinstance(f(1), Function)
+    assert isinstance(f(1)(2), Function)
+    assert f(1, 2).map(lambda h: h(0))(3) == 1
+    # Results are returned as they are
+    assert f(1, 2, 3) is g
+    assert f(1)(2)(3) is g
+    assert type(_RawFunction(lambda: lambda x: x)()) is not Function
+    return
+
+
+def test_function_subclass_metainformation():
+    import inspect
+
+    class Documented(Function):
+        """Subclass docstring"""
+
+    # Subclasses keep their own docstring and module
+    assert inspect.getdoc(Documented) == "Subclass docstring"
+    assert Documented.__module__ == __name__
+    assert inspect.getdoc(FunctionMonoid(Sum)) == \
+        "Function type with Monoid instance added"
+    assert FunctionMonoid(Sum).__module__ == "haskpy.functions"
+    return
+
+
+def benchmark_raw_function():
+
+    import timeit
+    from haskpy import functions
+    from haskpy.functions import function, _raw_function
+    from haskpy.types.list import List
+
+    def run(name, g, number=10000):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:8.2f} us".format(name, 1e6 * t))
+        return
+
+    xs = List(1, 2, 3)
+    inc = lambda x: x + 1
+
+    def map_(f, xs):
+        return xs.map(f)
+
+    def cross(f, g, ab):
+        return (f(ab[0]), g(ab[1]))
+
+    for (name, decorate) in [
+            ("function", function),
+            ("_raw_function", _raw_function),
+    ]:
+        m = decorate(map_)
+        c = decorate(cross)
+        print(name)
+        run("  map(f, xs)", lambda: m(inc, xs))
+        run("  map(f)(xs)", lambda: m(inc)(xs))
+        run("  cross(f, g, (1, 2))", lambda: c(inc, inc, (1, 2)))
+        run("  cross(f)(g)((1, 2))", lambda: c(inc)(inc)((1, 2)))
+
+    return
+
+
+def test_function_method():
+
+    import copy
+    from haskpy.functions import function
+
+    class A():
+
+        @function
+        def method(self, x, y):
+            """Docstring"""
+            return (self, x, y)
+
+    class B(A):
+
+        @function
+        def method(self, x, y):
+            return ("B", super().method(x, y))
+
+    class C():
+        __slots__ = ()
+        method = A.method
+
+    a = A()
+    assert a.method(1, 2) == (a, 1, 2)
+    assert a.method(1)(2) == (a, 1, 2)
+    assert a.method.__doc__ == "Docstring"
+    assert A.method(a, 1, 2) == (a, 1, 2)
+
+    # Copies don't use the methods bound to the original object
+    a.method
+    a_copy = copy.copy(a)
+    assert a_copy.method(1, 2)[0] is a_copy
+    assert a.method(1, 2)[0] is a
+
+    # Methods of parent classes with the same name don't collide
+    b = B()
+    assert b.method(1, 2) == ("B", (b, 1, 2))
+
+    # Objects without __dict__ work too
+    c = C()
+    assert c.method(1, 2) == (c, 1, 2)
+
+    # Method lookups don't store anything in the instance, so it can still be
+    # pickled and isn't kept alive by reference cycles
+    import gc
+    import pickle
+    import weakref
+    a = Picklable(42)
+    a.method(1, 2)
+    assert vars(a) == {"value": 42}
+    assert pickle.loads(pickle.dumps(a)).value == 42
+    ref = weakref.ref(a)
+    gc.disable()
+    try:
+        del a
+        assert ref() is None
+    finally:
+        gc.enable()
+    return
+
+
+class Picklable():
+    """Class with a method at module level so that pickle finds it"""
+
+    def __init__(self, value):
+        self.value = value
+        return
+
+    @function
+    def method(self, x, y):
+        return (self.value, x, y)
+
+
+def benchmark_function_method():
+
+    import functools
+    import timeit
+    from haskpy.functions import function
+
+    class Partial(Function):
+
+        def __get__(self, obj, objtype):
+            # Function.__get__ with a partial object
+            if obj is not None:
+                fp = functools.partial(self, obj)
+                fp.__doc__ = self.__doc__
+                return Function(fp)
+            else:
+                return self
+
+    def method(self, x):
+        return x
+
+    class A():
+        bound = function(method)
+        partial = Partial(function(method))
+
+    a = A()
+
+    def run(name, g, number=100000):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<24}{1:8.2f} us".format(name, 1e6 * t))
+        return
+
+    run("partial lookup", lambda: a.partial)
+    run("method lookup", lambda: a.bound)
+    run("partial call", lambda: a.partial(1))
+    run("method call", lambda: a.bound(1))
+    return
+
+
+def test_memoize():
+
+    import pytest
+    from haskpy.functions import memoize
+
+    calls = []
+
+    def f(x, y, z=0):
+        """Docstring"""
+        calls.append((x, y, z))
+        return (x, y, z)
+
+    g = memoize(f, maxsize=2)
+    assert isinstance(g, Function)
+    assert g.__doc__ == "Docstring"
+
+    # The cache is keyed on the full argument tuple, so partial applications
+    # don't touch the cache
+    assert g(1, 2) == (1, 2, 0)
+    assert g(1)(2) == (1, 2, 0)
+    assert g(1, 2) == (1, 2, 0)
+    assert calls == [(1, 2, 0)]
+    assert g.cache_info() == (2, 1, 0, 2, 1)
+
+    # Unhashable arguments are compared for equality
+    assert g([1], 2) == ([1], 2, 0)
+    assert g([1])(2) == ([1], 2, 0)
+    assert len(calls) == 2
+    assert g.cache_info() == (3, 2, 0, 2, 2)
+
+    # Least recently used results are evicted: (1, 2) was used before [1]
+    assert g(1, 2, z=3) == (1, 2, 3)
+    assert g.cache_info() == (3, 3, 1, 2, 2)
+    assert g([1], 2) == ([1], 2, 0)
+    assert g(1, 2) == (1, 2, 0)
+    assert len(calls) == 4
+    assert g.cache_info() == (4, 4, 2, 2, 2)
+
+    # Clearing the cache
+    g.cache_clear()
+    assert g.cache_info() == (0, 0, 0, 2, 0)
+    assert g(1, 2) == (1, 2, 0)
+    assert len(calls) == 5
+
+    # Typed keys
+    h = memoize(lambda x: x, typed=True)
+    assert type(h(1)) is int
+    assert type(h(1.0)) is float
+    assert h.cache_info().misses == 2
+
+    # Without a size limit
+    k = memoize(lambda x: x, maxsize=None)
+    for i in range(1000):
+        k(i)
+    assert k.cache_info() == (0, 1000, 0, None, 1000)
+
+    # No caching
+    n = memoize(lambda x: x, maxsize=0)
+    n([1])
+    n([1])
+    assert n.cache_info() == (0, 2, 0, 0, 0)
+
+    # Errors in the arguments are raised
+    with pytest.raises(TypeError):
+        g(1, 2, 3, 4)
+    with pytest.raises(TypeError):
+        g(1, foo=2)
+
+    # Failing calls don't leave unhashable keys behind
+    def fail(x):
+        raise ValueError()
+
+    m = memoize(fail, maxsize=2)
+    for i in range(100):
+        with pytest.raises(ValueError):
+            m([i])
+    assert m.cache_info() == (0, 100, 0, 2, 0)
+    assert len(m._MemoizedFunction__cache.unhashable) == 0
+
+    # Keywords with the names of positional-only parameters go to **kwargs
+    p = memoize(lambda a, /, **kwargs: (a, kwargs))
+    assert p(1, a=2) == (1, {"a": 2})
+    return
+
+
+def benchmark_memoize():
+
+    import timeit
+    from haskpy.functions import memoize
+    from haskpy import testing
+
+    def run(name, g, number):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:8.2f} us".format(name, 1e6 * t))
+        return
+
+    for n in [10, 1000]:
+        f = testing.memoize(lambda x: x)
+        g = memoize(lambda x: x, maxsize=None)
+        for i in range(n):
+            f(i)
+            g(i)
+        print("{0} cached values".format(n))
+        run("  testing.memoize", lambda: f(n - 1), 10000)
+        run("  memoize", lambda: g(n - 1), 10000)
+        run("  memoize (unhashable)", lambda: g([n - 1]), 100)
+
+    return
+
+
+def test_short_circuit_folds():
+
+    from haskpy.functions import any, all, find, fold_until
+    from haskpy.typeclasses import Foldable
+    from haskpy.types import Stream, List, Just, Nothing, Left, Right
+
+    class Range(Foldable):
+        """Foldable with only fold_map implemented, counting the visits"""
+
+        def __init__(self, n):
+            self.n = n
+            self.visited = 0
+
+        def fold_map(self, monoid, f):
+            m = monoid.empty
+            for x in range(self.n):
+                self.visited += 1
+                m = m.append(f(x))
+            return m
+
+    def visits(g, n=1000):
+        xs = Range(n)
+        return (g(xs), xs.visited)
+
+    # The default any and all stop inside the fold_map of the instance
+    assert visits(any(lambda x: x == 3)) == (True, 4)
+    assert visits(all(lambda x: x < 3)) == (False, 4)
+    assert visits(any(lambda x: x < 0)) == (False, 1000)
+    assert visits(all(lambda x: x >= 0)) == (True, 1000)
+    assert visits(any(lambda x: x == 3), 0) == (False, 0)
+
+    # Infinite foldables
+    naturals = Stream.iterate(lambda x: x + 1, 0)
+    assert any(lambda x: x > 100, naturals)
+    assert not all(lambda x: x < 100, naturals)
+    assert find(lambda x: x * x > 50, naturals) == Just(8)
+    assert fold_until(
+        lambda acc, x: Left(acc) if x > 4 else Right(acc + x),
+        0,
+        naturals,
+    ) == Left(10)
+
+    xs = List(1, 2, 3)
+    assert find(lambda x: x > 1, xs) == Just(2)
+    assert find(lambda x: x > 3, xs) == Nothing
+    assert fold_until(lambda acc, x: Right(acc + x), 0, xs) == Right(6)
+
+    # Nested folds don't stop each other
+    assert find(lambda ys: not any(lambda y: y > 1, ys), List(xs, List(0))) \
+        == Just(List(0))
+
+    # Maybe folds are trivial
+    assert Just(3).any(lambda x: x > 2)
+    assert not Just(3).all(lambda x: x > 3)
+    assert Just(3).find(lambda x: x > 3) == Nothing
+    assert Just(3).fold_until(lambda acc, x: Left(acc + x), 1) == Left(4)
+    assert not Nothing.any(lambda x: True)
+    assert Nothing.all(lambda x: False)
+    assert Nothing.fold_until(lambda acc, x: Left(x), 1) == Right(1)
+    return
+
+
+def benchmark_short_circuit_folds():
+
+    import timeit
+    import warnings
+    from haskpy.typeclasses import Foldable
+    from haskpy.types import List
+    from haskpy.utils import PerformanceWarning
+
+    class FoldMapOnly(Foldable):
+        """Foldable with only fold_map implemented"""
+
+        def __init__(self, xs):
+            self.xs = xs
+
+        def fold_map(self, monoid, f):
+            return List.fold_map(self.xs, monoid, f)
+
+    def run(name, g, number=3):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.3f} ms".format(name, 1e3 * t))
+        return
+
+    warnings.simplefilter("ignore", PerformanceWarning)
+    for n in [1000, 100000]:
+        xs = FoldMapOnly(List.from_iter(range(n)))
+        for (name, p) in [
+                ("match first", lambda x: x == 1),
+                ("no match", lambda x: x < 0),
+        ]:
+            print("{0} values, {1}".format(n, name))
+            run("  builtin any over to_iter", lambda: any(map(p, xs.to_iter())))
+            run("  any", lambda: xs.any(p))
+            run("  find", lambda: xs.find(p))
+
+    return
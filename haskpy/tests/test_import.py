@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+
+import haskpy
+
+
+def _python(*args):
+    """Run Python in a new process with this haskpy importable"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(haskpy.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_without_hypothesis():
+    # Hypothesis isn't imported until the test machinery is used
+    out = _python(
+        "-c",
+        "import sys, haskpy; "
+        "print('hypothesis' in sys.modules); "
+        "haskpy.List.sample_value(haskpy.st.integers()); "
+        "print('hypothesis' in sys.modules)",
+    )
+    assert out.stdout.split() == ["False", "True"]
+
+    # Importing and using haskpy works when Hypothesis isn't installed
+    out = _python(
+        "-c",
+        "import sys; sys.modules['hypothesis'] = None; "
+        "from haskpy import List, Just, map; "
+        "print(repr(map(lambda x: x + 1, List(1, 2)))); "
+        "print(repr(Just(1).bind(lambda x: Just(x + 1))))",
+    )
+    assert out.stdout.splitlines() == ["List(2, 3)", "Just(2)"]
+    return
+
+
+def test_lazy_namespace():
+    import types
+    import importlib
+
+    modules = {
+        m: importlib.import_module("haskpy." + m)
+        for m in haskpy._submodules
+    }
+
+    # The names resolve to the same objects as in the submodules and each name
+    # is exported by only one submodule
+    for (m, module) in modules.items():
+        assert m in dir(haskpy)
+        assert getattr(haskpy, m) is module
+        for name in module.__all__:
+            assert getattr(haskpy, name) is getattr(module, name)
+            assert name in dir(haskpy)
+            assert [
+                other for other in modules.values() if name in other.__all__
+            ] == [module]
+    assert haskpy.compose is modules["functions"].compose
+
+    # Star-import exports all the names except those shadowing builtins
+    assert set(haskpy.__all__) == haskpy._names() - {"any", "all"}
+    assert haskpy.any is modules["functions"].any
+    assert haskpy.all is modules["functions"].all
+
+    # The public names defined in the submodules are listed in their __all__
+    # except the testing helpers of utils whose call conventions differ from
+    # Hypothesis
+    internal = {"given", "composite"}
+    for (m, module) in modules.items():
+        for name in dir(module):
+            value = getattr(module, name)
+            if name.startswith("_") or isinstance(value, types.ModuleType):
+                continue
+            defined = getattr(value, "__module__", None)
+            if not isinstance(defined, str):
+                continue
+            if defined.startswith(module.__name__):
+                assert (name in module.__all__) != (name in internal), name
+    for name in internal:
+        assert name not in dir(haskpy)
+        assert not hasattr(haskpy, name)
+
+    # Only the submodules that are needed are imported
+    out = _python(
+        "-c",
+        "import sys; from haskpy import map; "
+        "print(sorted({'haskpy.types', 'haskpy.optics', 'haskpy.autoclass', "
+        "'sphinx', 'hypothesis'} & set(sys.modules)))",
+    )
+    assert out.stdout.strip() == "[]"
+    return
+
+
+def benchmark_import_time():
+
+    def importtime(module):
+        """Cumulative import times in microseconds from -X importtime"""
+        out = _python("-X", "importtime", "-c", "import {}".format(module))
+        times = {}
+        for line in out.stderr.splitlines()[1:]:
+            (_, cumulative, name) = line.split("|")
+            times.setdefault(name.strip(), int(cumulative))
+        return times
+
+    def run(statement, number=5):
+        """Cold-start time of the statement in a new process"""
+        t = min(
+            float(_python(
+                "-c",
+                "import time; t = time.perf_counter(); {0}; "
+                "print(time.perf_counter() - t)".format(statement),
+            ).stdout)
+            for _ in range(number)
+        )
+        print("{0:<32}{1:10.2f} ms".format(statement, 1e3 * t))
+        return
+
+    run("import hypothesis")
+    run("import haskpy")
+    run("from haskpy import map")
+    run("from haskpy import List")
+    run("from haskpy import *")
+    times = importtime("haskpy.types")
+    print("Slowest imports of haskpy.types:")
+    for (name, t) in sorted(times.items(), key=lambda x: -x[1])[1:11]:
+        print("  {0:<40}{1:10.2f} ms".format(name, 1e-3 * t))
+
+    return
@@ -10,12 +10,20 @@ def test_curry():
         def run(check):
             check(utils.curry(f))
             check(utils.curry(utils.curry(f)))
+            check(utils.curry(f, compiled=True))
+            check(utils.curry(utils.curry(f, compiled=True), compiled=True))
+            check(utils.curry(utils.curry(f, compiled=True)))
+            check(utils.curry(f, checked=True))
+            check(utils.curry(utils.curry(f, checked=True), checked=True))
+            check(utils.curry(utils.curry(f), checked=True))
             # toolz.curry doesn't handle nesting properly and fails some of
             # these tests:
             g = lambda *args, **kwargs: utils.curry(f)(*args, **kwargs)
             check(g)
             check(utils.curry(g))
             check(utils.curry(utils.curry(g)))
+            check(utils.curry(g, compiled=True))
+            check(utils.curry(g, checked=True))
             return
         return run
 
@@ -68,6 +76,20 @@ def test_curry():
         return
 
 
+    @run_check(lambda x, /, y: x - y)
+    def check_positional_only(f):
+        assert f(5, 3) == 2
+        assert f(5)(3) == 2
+        assert f(5)(y=3) == 2
+        assert f(y=3)(5) == 2
+        # Positional-only arguments can't be given as keyword arguments
+        with pytest.raises(TypeError):
+            f(x=5)
+        with pytest.raises(TypeError):
+            f(x=5, y=3)
+        return
+
+
     @run_check(lambda foo=42: foo + 1)
     def check_kw_only(f):
         assert f(foo=10) == 11
@@ -195,6 +217,10 @@ def test_curry():
     # Invalid arguments to curry. (Note that curry itself isn't curried.)
     with pytest.raises(TypeError):
         utils.curry(42)
+    with pytest.raises(TypeError):
+        utils.curry(42, compiled=True)
+    with pytest.raises(TypeError):
+        utils.curry(42, checked=True)
     with pytest.raises(TypeError):
         utils.curry("foo")
     with pytest.raises(TypeError):
@@ -234,6 +260,99 @@ def test_curry():
     return
 
 
+def test_update_argspec():
+
+    import inspect
+    import functools
+
+    def f1(x, y):
+        pass
+
+    def f2(x, y=1, z=2):
+        pass
+
+    def f3(x, *args, k, m=3, **kwargs):
+        pass
+
+    def f4(*args, **kwargs):
+        pass
+
+    def f5(a, b: int, c=1, *, d, e: str = "e") -> int:
+        pass
+
+    def f6(a, b, /, c=3):
+        pass
+
+    calls = [
+        ((), {}),
+        ((1,), {}),
+        ((1, 2), {}),
+        ((1, 2, 3, 4), {}),
+        ((), {"x": 1}),
+        ((), {"y": 2}),
+        ((1,), {"x": 1}),
+        ((1,), {"y": 2}),
+        ((), {"z": 3}),
+        ((), {"foo": 4}),
+        ((1,), {"m": 5, "k": 6}),
+        ((1,), {"b": 2, "e": "f"}),
+        ((), {"d": 7}),
+    ]
+
+    def getfullargspec(f, *args, **kwargs):
+        try:
+            return inspect.getfullargspec(functools.partial(f, *args, **kwargs))
+        except TypeError:
+            return TypeError
+
+    def update_argspec(spec, fp):
+        try:
+            return utils.update_argspec(spec, fp.args, fp.keywords)
+        except TypeError:
+            return TypeError
+
+    for f in [f1, f2, f3, f4, f5, f6]:
+        spec = utils.getfullargspec(f)
+        assert spec == inspect.getfullargspec(f)
+        for (args1, kwargs1) in calls:
+            for (args2, kwargs2) in calls:
+                # Partial objects are flattened so the argspec of a partially
+                # evaluated function can always be found by updating the
+                # argspec of the original function
+                fp = functools.partial(
+                    functools.partial(f, *args1, **kwargs1),
+                    *args2,
+                    **kwargs2,
+                )
+                assert fp.func is f
+                assert update_argspec(spec, fp) == getfullargspec(fp)
+
+    # Positional-only parameters can't be given as keyword arguments
+    spec = utils.getfullargspec(f6)
+    assert spec.posonlyargs == ("a", "b")
+    assert utils.update_argspec(spec, (1,), {}).posonlyargs == ("b",)
+    with pytest.raises(TypeError):
+        utils.update_argspec(spec, (), {"a": 1})
+    with pytest.raises(TypeError):
+        utils.update_argspec(spec, (1,), {"b": 2})
+
+    # ...unless there's **kwargs which then gets them
+    def f7(a, /, **kwargs):
+        pass
+
+    spec = utils.getfullargspec(f7)
+    assert (
+        utils.update_argspec(spec, (1,), {"a": 2}) ==
+        inspect.getfullargspec(functools.partial(f7, 1, a=2))
+    )
+    new_spec = utils.update_argspec(spec, (), {"a": 2})
+    assert new_spec.args == ["a"]
+    assert new_spec.posonlyargs == ("a",)
+    assert new_spec.kwonlydefaults is None
+
+    return
+
+
 def benchmark_curry():
 
     import toolz
@@ -292,6 +411,232 @@ def benchmark_curry():
     return
 
 
+def benchmark_curry_partial():
+
+    import inspect
+    import functools
+    import timeit
+
+    def curry_before(f):
+        """Baseline curry that finds the argspec on each partial evaluation"""
+
+        def wrapped(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except TypeError:
+                fp = functools.partial(f, *args, **kwargs)
+                try:
+                    spec = inspect.getfullargspec(fp)
+                except TypeError:
+                    pass
+                else:
+                    if utils.count_required_arguments(spec) > 0:
+                        return curry_before(fp)
+                raise
+
+        return utils.wraps(f)(wrapped)
+
+    def f(x, y, z, *args, prefix="", **kwargs):
+        return prefix + x + y + z
+
+    def run(name, g, number=10000):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<24}{1:8.2f} us".format(name, 1e6 * t))
+        return
+
+    for (name, curry) in [("before", curry_before), ("after", utils.curry)]:
+        fh = curry(f)
+        fa = fh("a")
+        print(name)
+        run("  f('a')", lambda: fh("a"))
+        run("  fa('b')", lambda: fa("b"))
+        run("  f(y='b')", lambda: fh(y="b"))
+        run("  f('a', 'b', 'c')", lambda: fh("a", "b", "c"))
+
+    return
+
+
+def test_curry_compiled():
+
+    import inspect
+
+    def f(x, y, z):
+        """Concatenate"""
+        return x + y + z
+
+    fc = utils.curry(f, compiled=True)
+
+    # Metainformation of the original function is kept
+    assert fc.__doc__ == "Concatenate"
+    assert fc.__name__ == "f"
+    assert str(inspect.signature(fc)) == "(x, y, z)"
+    assert str(inspect.signature(fc("a"))) == "(y, z)"
+
+    # Positional-only parameters are supported too
+    g = lambda x, y, /: x - y
+    gc = utils.curry(g, compiled=True)
+    assert gc(5)(3) == 2
+    assert gc()(5, 3) == 2
+    with pytest.raises(TypeError):
+        gc(5, 3, 1)
+    with pytest.raises(TypeError):
+        gc(x=5)
+
+    # Signatures with defaults, *args, keyword-only arguments or **kwargs
+    # fall back to the generic curry
+    h = utils.curry(lambda x, y=1, *args, z, **kwargs: x + y + z)
+    hc = utils.curry(lambda x, y=1, *args, z, **kwargs: x + y + z, compiled=True)
+    assert h(1, z=3) == hc(1, z=3) == 5
+    assert h(1)(z=3) == hc(1)(z=3) == 5
+
+    return
+
+
+def benchmark_curry_compiled():
+
+    import timeit
+
+    def f(x, y, z):
+        return
+
+    def run(name, g, number=100000):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<24}{1:8.2f} us".format(name, 1e6 * t))
+        return
+
+    for (name, fh) in [
+            ("curry", utils.curry(f)),
+            ("curry(compiled=True)", utils.curry(f, compiled=True)),
+    ]:
+        fa = fh(1)
+        print(name)
+        run("  f(1, 2, 3)", lambda: fh(1, 2, 3))
+        run("  fa(2, 3)", lambda: fa(2, 3))
+        run("  f(1)", lambda: fh(1), number=10000)
+        run("  fa(2)", lambda: fa(2), number=10000)
+
+    return
+
+
+def test_curry_checked():
+
+    calls = []
+
+    def f(x, y, z=3):
+        calls.append((x, y, z))
+        raise TypeError("raised inside the function")
+
+    # Partial evaluations don't call the function
+    fc = utils.curry(f, checked=True)
+    fa = fc(1)
+    fb = fa()(z=4)
+    assert calls == []
+    # TypeErrors raised inside the function are propagated
+    with pytest.raises(TypeError, match="inside"):
+        fb(2)
+    with pytest.raises(TypeError, match="inside"):
+        fa(2)
+    assert calls == [(1, 2, 4), (1, 2, 3)]
+    # Invalid arguments raise without calling the function
+    with pytest.raises(TypeError):
+        fa(x=2)
+    with pytest.raises(TypeError):
+        fc(foo=2)
+    assert len(calls) == 2
+
+    class A():
+
+        def __init__(self, x, y=0):
+            raise TypeError("raised inside __init__")
+
+        def method(self, x, y):
+            raise TypeError("raised inside the method")
+
+    # The bound first argument isn't counted as a missing argument. Both the
+    # generic and the checked curry raise the error of the function itself
+    # instead of returning a partially evaluated function.
+    for curry in [utils.curry, lambda g: utils.curry(g, checked=True)]:
+        with pytest.raises(TypeError, match="inside the method"):
+            curry(A.__new__(A).method)(1, 2)
+        with pytest.raises(TypeError, match="inside __init__"):
+            curry(A)(1, 2)
+        with pytest.raises(TypeError, match="inside __init__"):
+            curry(A)(1)
+        with pytest.raises(TypeError, match="inside the method"):
+            curry(A.__new__(A).method)(1)(2)
+
+    # Keyword arguments with the names of positional-only parameters go to
+    # **kwargs, similarly as in Python
+    def g(a, /, **kwargs):
+        return (a, kwargs)
+
+    gc = utils.curry(g, checked=True)
+    assert gc(1, a=2) == (1, {"a": 2})
+    assert gc(a=2)(1) == (1, {"a": 2})
+    assert gc(a=2)(1, a=3) == (1, {"a": 3})
+
+    return
+
+
+def benchmark_curry_checked():
+
+    import timeit
+
+    def f(x, y, z):
+        return
+
+    def g(x, y, z):
+        raise TypeError()
+
+    def run(name, h, number=100000):
+        t = timeit.timeit(h, number=number) / number
+        print("{0:<24}{1:8.2f} us".format(name, 1e6 * t))
+        return
+
+    def raising(h):
+        def run():
+            try:
+                h(1, 2, 3)
+            except TypeError:
+                pass
+        return run
+
+    for (name, fh, gh) in [
+            ("curry", utils.curry(f), utils.curry(g)),
+            ("curry(checked=True)", utils.curry(f, checked=True),
+             utils.curry(g, checked=True)),
+    ]:
+        fa = fh(1)
+        print(name)
+        run("  f(1, 2, 3)", lambda: fh(1, 2, 3))
+        run("  f(1)", lambda: fh(1), number=10000)
+        run("  fa(2)", lambda: fa(2), number=10000)
+        run("  f(z=3)", lambda: fh(z=3), number=10000)
+        run("  g(1, 2, 3) raising", raising(gh), number=10000)
+
+    return
+
+
+def test_reduce_balanced():
+
+    # The order of the values is kept
+    for n in range(40):
+        xs = [str(i) + "," for i in range(n)]
+        assert utils.reduce_balanced(lambda x, y: x + y, xs, "") == "".join(xs)
+
+    # The values are combined in a balanced tree
+    assert utils.reduce_balanced(
+        lambda x, y: "({0}{1})".format(x, y),
+        "abcdefg",
+        "",
+    ) == "(((ab)(cd))((ef)g))"
+
+    # The values are consumed lazily
+    assert utils.reduce_balanced(lambda x, y: x + y, iter(range(100)), 0) == \
+        4950
+    return
+
+
 def test_class_property():
 
     class A():
@@ -468,3 +813,238 @@ def test_abstract_class_property():
     # assert "foo" not in dir(A())
 
     return
+
+
+def test_nonexisting_function():
+
+    from haskpy.typeclasses import Type
+
+    class A(Type):
+
+        def __init__(self, x):
+            self.x = x
+
+        def __eq__(self, other):
+            return self.x == other.x
+
+    class B(A):
+
+        @utils.nonexisting_function
+        def __eq__(self, other):
+            pass
+
+        @utils.nonexisting_function
+        def __hash__(self):
+            pass
+
+    assert "__ne__" not in dir(A(1))
+    assert "__eq__" in dir(A(1))
+    assert "__eq__" not in dir(B(1))
+    assert "x" in dir(B(1))
+    assert A(1) == A(1)
+    with pytest.raises(TypeError, match="Class B has no __eq__ method"):
+        B(1) == B(1)
+    with pytest.raises(TypeError, match="Class B has no __hash__ method"):
+        hash(B(1))
+    with pytest.raises(TypeError, match="Class A has no __str__ method"):
+        str(A(1))
+    return
+
+
+def benchmark_attribute_access():
+
+    import timeit
+    from haskpy.types import List
+
+    class HookedList(List):
+        """List with the attribute hook that Type used to have"""
+
+        def __getattribute__(self, name):
+            attr = super().__getattribute__(name)
+            if isinstance(attr, utils.nonexisting_function):
+                raise AttributeError()
+            else:
+                return attr
+
+    def run(name, g, number=1000000):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.3f} us".format(name, 1e6 * t))
+        return
+
+    f = lambda x: x
+    for M in [HookedList, List]:
+        xs = M(1, 2, 3)
+        print(M.__name__)
+        run("  attribute access", lambda: xs.map)
+        run("  method call", lambda: xs.length())
+        run("  map", lambda: xs.map(f))
+
+    return
+
+
+def test_immutable_slots():
+
+    import attr
+    import pickle
+    from haskpy.functions import Function
+    from haskpy.types import (
+        Just,
+        Nothing,
+        Left,
+        Right,
+        Identity,
+        Sum,
+        And,
+        Or,
+        String,
+        Endo,
+        List,
+        LinkedList,
+        Seq,
+        Stream,
+        Done,
+    )
+
+    values = [
+        Just(1),
+        Nothing,
+        Left(1),
+        Right(1),
+        Identity(1),
+        Sum(1),
+        And(True),
+        Or(True),
+        String("a"),
+        Endo(abs),
+        List(1),
+        LinkedList(1),
+        Seq(1),
+        Stream(1),
+        Done(1),
+        Function(abs),
+    ]
+    for x in values:
+        # No per-instance dictionary
+        assert not hasattr(x, "__dict__")
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            x.foo = 42
+
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        Just(1)._Just__x = 2
+    assert pickle.loads(pickle.dumps(Just(Sum(1)))) == Just(Sum(1))
+    assert pickle.loads(pickle.dumps(Left(1))) == Left(1)
+    return
+
+
+def benchmark_immutable_slots():
+
+    import attr
+    import timeit
+    import tracemalloc
+    from haskpy.typeclasses import Monad
+    from haskpy.types import Just, Left, Identity, Sum, List, Done
+
+    @utils.immutable(slots=False)
+    class DictIdentity(Monad):
+        """Identity-like value with a per-instance __dict__"""
+
+        x = attr.ib()
+
+    def memory(make, n=100000):
+        tracemalloc.start()
+        xs = [make(i) for i in range(n)]
+        (size, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del xs
+        return size / n
+
+    def run(name, make, number=200000):
+        # Subtract the memory of the list and the integers
+        size = memory(make) - memory(lambda i: i)
+        t = min(timeit.repeat(lambda: make(1), number=number, repeat=3))
+        print("{0:<32}{1:8.1f} bytes{2:10.3f} us".format(
+            name,
+            size,
+            1e6 * t / number,
+        ))
+        return
+
+    print("{0:<32}{1:>14}{2:>13}".format("", "memory", "construct"))
+    run("__dict__ (slots=False)", DictIdentity)
+    for M in [Just, Left, Identity, Sum, List, Done]:
+        run(M.__name__, M)
+
+    return
+
+
+def test_type_constructor():
+    from haskpy.types import Compose, MaybeT, IdentityT, List, Maybe, Just, Sum
+    from haskpy.functions import FunctionMonoid
+
+    # Repeated applications give the same class
+    assert Compose(List, Maybe) is Compose(List, Maybe)
+    assert Compose(List, Maybe) is not Compose(Maybe, List)
+    assert MaybeT(List) is MaybeT(List)
+    assert IdentityT(List) is IdentityT(List)
+    assert FunctionMonoid(Sum) is FunctionMonoid(Sum)
+
+    # Values created in different places have the same type
+    x = Compose(List, Maybe)(List(Just(1)))
+    assert isinstance(x, Compose(List, Maybe))
+    assert type(x.map(lambda y: y + 1)) is type(x)
+
+    @utils.type_constructor
+    def Wrap(X):
+        """Docstring"""
+        return type("Wrap", (X,), {})
+
+    assert Wrap.__doc__ == "Docstring"
+    W = Wrap(int)
+    assert Wrap(int) is W
+    info = Wrap.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # Clearing creates a new class next time
+    Wrap.cache_clear()
+    assert Wrap.cache_info().currsize == 0
+    assert Wrap(int) is not W
+    return
+
+
+def benchmark_type_constructor():
+
+    import timeit
+    from haskpy.types import Compose, MaybeT, IdentityT, List, Maybe, Just, Sum
+    from haskpy.functions import FunctionMonoid
+
+    def run(name, f, number=1000):
+        t = min(timeit.repeat(f, number=number, repeat=3)) / number
+        print("{0:<32}{1:10.2f} us".format(name, 1e6 * t))
+        return
+
+    # Code that applies a type constructor in a loop. The original functions
+    # without the cache create a new class on every call.
+    loops = [
+        (
+            Compose,
+            lambda C: C(List, Maybe)(List(Just(1))),
+        ),
+        (
+            MaybeT,
+            lambda T: T(List).pure(1).bind(lambda x: T(List).pure(x + 1)),
+        ),
+        (
+            IdentityT,
+            lambda T: T(List).pure(1),
+        ),
+        (
+            FunctionMonoid,
+            lambda F: F(Sum).empty,
+        ),
+    ]
+    for (c, f) in loops:
+        print(c.__name__)
+        run("  uncached", lambda: f(c.__wrapped__))
+        run("  cached", lambda: f(c))
+
+    return
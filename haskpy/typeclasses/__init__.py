@@ -24,3 +24,21 @@ from .monoid import Monoid, CommutativeMonoid
 from .foldable import Foldable
 from .hashable import *
 from .eq import Eq
+
+__all__ = [
+    "Applicative",
+    "Cartesian",
+    "Cocartesian",
+    "Commutative",
+    "CommutativeMonoid",
+    "Contravariant",
+    "Eq",
+    "Foldable",
+    "Functor",
+    "Hashable",
+    "Monad",
+    "Monoid",
+    "Profunctor",
+    "Semigroup",
+    "Type",
+]
@@ -1,7 +1,4 @@
-from hypothesis import given
-import hypothesis.strategies as st
-
-from haskpy.utils import identity, assert_output
+from haskpy.utils import identity, assert_output, st, given
 from .functor import Functor
 from haskpy import testing, utils
 
@@ -14,6 +11,8 @@ class Applicative(Functor):
 
     """
 
+    __slots__ = ()
+
     @utils.abstract_class_function
     def pure(cls, x):
         """a -> m a"""
@@ -99,7 +98,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_identity(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -120,7 +119,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_composition(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -144,7 +143,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_homomorphism(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -166,7 +165,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_interchange(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -194,7 +193,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_apply(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -218,7 +217,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_sequence(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -240,7 +239,7 @@ class Applicative(Functor):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_applicative_map(cls, data):
         """Test consistency between Applicative and Functor implementations"""
         # Draw types
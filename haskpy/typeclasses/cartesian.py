@@ -1,8 +1,5 @@
-from hypothesis import given
-from hypothesis import strategies as st
-
 from .profunctor import Profunctor
-from haskpy.utils import assert_output, class_function
+from haskpy.utils import assert_output, class_function, st, given
 from haskpy import testing
 
 
@@ -20,6 +17,8 @@ class Cartesian(Profunctor):
 
     """
 
+    __slots__ = ()
+
     def first(self):
         """p a b -> p (a, c) (b, c)"""
         return self.second().dimap(_flip_tuple, _flip_tuple)
@@ -43,7 +42,7 @@ class Cartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cartesian_identity(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -70,7 +69,7 @@ class Cartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cartesian_associativity(cls, data):
         # Draw types
         a = st.tuples(
@@ -101,7 +100,7 @@ class Cartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cartesian_first(cls, data):
         # Draw types
         a1 = data.draw(testing.sample_hashable_type())
@@ -128,7 +127,7 @@ class Cartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cartesian_second(cls, data):
         # Draw types
         a1 = data.draw(testing.sample_hashable_type())
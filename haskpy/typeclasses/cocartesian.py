@@ -1,8 +1,5 @@
-from hypothesis import given
-from hypothesis import strategies as st
-
 from .profunctor import Profunctor
-from haskpy.utils import assert_output, class_function
+from haskpy.utils import assert_output, class_function, st, given
 from haskpy import testing
 
 
@@ -20,6 +17,8 @@ class Cocartesian(Profunctor):
 
     """
 
+    __slots__ = ()
+
     def left(self):
         return self.right().dimap(_flip_either, _flip_either)
 
@@ -42,7 +41,7 @@ class Cocartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cocartesian_unit(cls, data):
         from haskpy.types import Left
         # Draw types
@@ -83,7 +82,7 @@ class Cocartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cocartesian_associativity(cls, data):
         from haskpy.types.either import Either
         # Draw types
@@ -115,7 +114,7 @@ class Cocartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cocartesian_left(cls, data):
         from haskpy.types.either import Either
         # Draw types
@@ -143,7 +142,7 @@ class Cocartesian(Profunctor):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_cocartesian_right(cls, data):
         from haskpy.types.either import Either
         # Draw types
@@ -1,8 +1,5 @@
-from hypothesis import given
-from hypothesis import strategies as st
-
 from .typeclass import Type
-from haskpy.utils import identity, assert_output, class_function
+from haskpy.utils import identity, assert_output, class_function, st, given
 from haskpy import testing
 
 
@@ -15,6 +12,8 @@ class Contravariant(Type):
 
     """
 
+    __slots__ = ()
+
     def contramap(self, f):
         """f b -> (a -> b) -> f a"""
         raise NotImplementedError()
@@ -49,7 +48,7 @@ class Contravariant(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_contravariant_identity(cls, data):
         t = data.draw(cls.sample_type())
         cls.assert_contravariant_identity(
@@ -67,7 +66,7 @@ class Contravariant(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_contravariant_composition(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -96,7 +95,7 @@ class Contravariant(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_contravariant_contramap(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -120,7 +119,7 @@ class Contravariant(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_contravariant_contrareplace(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -11,6 +11,8 @@ class Eq(Type):
 
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """Equality comparison: ``Eq a => a -> a -> bool``
 
@@ -1,9 +1,8 @@
-import itertools
 from warnings import warn, filterwarnings, catch_warnings
-import hypothesis.strategies as st
-from hypothesis import given
 
 from haskpy.utils import (
+    st,
+    given,
     identity,
     PerformanceWarning,
     assert_output,
@@ -13,6 +12,34 @@ from haskpy import testing
 from .typeclass import Type
 
 
+class _Escape(Exception):
+    """Exception for stopping a fold early"""
+
+
+def _escape_fold(fold):
+    """Call ``fold(stop)`` where ``stop(result)`` ends the fold with the result
+
+    ``stop`` raises an exception that is caught only here, so it can be used
+    inside ``combine`` of any fold and the fold stops immediately. Nested folds
+    don't catch each other's exceptions.
+
+    """
+    escape = _Escape()
+
+    def stop(result):
+        escape.result = result
+        raise escape
+
+    try:
+        return fold(stop)
+    except _Escape as e:
+        if e is not escape:
+            raise
+        # Don't keep the frames of the fold alive
+        escape.__traceback__ = None
+        return escape.result
+
+
 class Foldable(Type):
     """Foldable typeclass
 
@@ -50,12 +77,20 @@ class Foldable(Type):
 
     """
 
+    __slots__ = ()
+
     def fold_map(self, monoid, f):
         """Monoid m => t a -> (a -> m) -> m (ignoring ``monoid`` argument)
 
         The default implementation is based on ``foldl`` (or, if not
         implemented, recursively on ``foldr``). Thus, all possibilities for
-        parallelism is lost.
+        parallelism is lost. The mapped values are combined with
+        ``monoid.mconcat``, which by default combines them in a balanced tree
+        (see ``haskpy.utils.reduce_balanced``) instead of accumulating them
+        from left to right. So monoids whose ``append`` copies the values
+        (e.g., ``String`` and ``List``) take O(n log n) instead of O(n^2) time,
+        and monoids with a bulk ``mconcat`` (e.g., ``Sum``) don't create
+        intermediate values at all.
 
         ``monoid`` is the monoidic class of the values inside the foldable. It
         is only used to determine the identity value.
@@ -72,10 +107,9 @@ class Foldable(Type):
         # NOTE: foldl and foldr are sequential because they cannot assume
         # initial is empty. But fold_map can be parallelized. Thus, we cannot
         # use foldl nor foldr here.
-        return self.foldl(
-            lambda m, x: m.append(f(x)),
-            monoid.empty,
-        )
+        ms = []
+        self.foldl(lambda _, x: ms.append(f(x)), None)
+        return monoid.mconcat(ms)
 
     def foldl(self, combine, initial):
         """t a -> (b -> a -> b) -> b -> b
@@ -100,12 +134,16 @@ class Foldable(Type):
         # The correct answer is:
         #
         # '(((x+a)+b)+c)'
-        from haskpy.functions import compose
+        #
+        # Thus, compose the functions ``b -> combine(b, a)`` in reversed order.
+        # Endo keeps the composition flat, so long foldables don't nest
+        # function calls.
+        from haskpy.types.monoids import Endo
         warn("Using default implementation of foldl", PerformanceWarning)
         return self.foldr(
-            lambda a, f: compose(f, lambda b: combine(b, a)),
-            identity,
-        )(initial)
+            lambda a, f: f.append(Endo(lambda b: combine(b, a))),
+            Endo.empty,
+        ).app_endo(initial)
 
     def foldr(self, combine, initial):
         """t a -> (a -> b -> b) -> b -> b
@@ -138,6 +176,114 @@ class Foldable(Type):
             lambda x: Endo(lambda y: combine(x, y)),
         ).app_endo(initial)
 
+    def foldr_lazy(self, combine, initial):
+        """t a -> (a -> Trampoline b -> Trampoline b) -> b -> b
+
+        Right fold that can stop early. ``combine`` gets the fold of the rest
+        of the foldable as a suspended ``Trampoline`` computation and returns
+        a ``Trampoline``. If ``combine`` doesn't use the rest, the fold stops,
+        so this works also for infinite foldables. For instance, find the
+        first value larger than ten:
+
+        .. code-block:: python
+
+            xs.foldr_lazy(
+                lambda x, rest: Done(x) if x > 10 else rest,
+                None,
+            )
+
+        Strict combiners map the rest, for instance, ``lambda x, rest:
+        rest.map(lambda acc: x + acc)``. The fold is evaluated in a loop, so it
+        doesn't hit the recursion limit either way.
+
+        The default implementation iterates over ``to_iter`` lazily via
+        ``Stream``, so the rest can be used more than once.
+
+        """
+        from haskpy.types.stream import Stream
+        return Stream.from_iter(self.to_iter()).foldr_lazy(combine, initial)
+
+    def fold_until(self, combine, initial):
+        """t a -> (b -> a -> Either c b) -> b -> Either c b
+
+        Left fold that can stop early. ``combine`` returns ``Right(acc)`` to
+        continue with a new accumulator or ``Left(result)`` to stop. The result
+        is the ``Left`` value that stopped the fold or, if the fold didn't
+        stop, ``Right`` of the final accumulator. For instance, sum the values
+        until the sum exceeds ten:
+
+        .. code-block:: python
+
+            xs.fold_until(
+                lambda acc, x: Left(acc + x) if acc + x > 10 else Right(acc + x),
+                0,
+            )
+
+        The default implementation stops ``foldl`` as soon as ``combine``
+        returns ``Left``, so the rest of the foldable isn't traversed if
+        ``foldl`` is implemented by the instance.
+
+        """
+        from haskpy.types.either import Left, Right
+
+        def fold(stop):
+            return Right(self.foldl(
+                lambda acc, x: combine(acc, x).match(
+                    Left=lambda c: stop(Left(c)),
+                    Right=identity,
+                ),
+                initial,
+            ))
+
+        return _escape_fold(fold)
+
+    def any(self, p):
+        """t a -> (a -> bool) -> bool
+
+        Stops at the first value that satisfies ``p``. The default
+        implementation folds with ``Or`` via ``fold_map`` and stops the fold
+        there, so only ``fold_map`` or ``foldl`` of the instance is used.
+
+        """
+        from haskpy.types.monoids import Or
+        return _escape_fold(
+            lambda stop: self.fold_map(
+                Or,
+                lambda x: stop(True) if p(x) else Or(False),
+            ).boolean
+        )
+
+    def all(self, p):
+        """t a -> (a -> bool) -> bool
+
+        Stops at the first value that doesn't satisfy ``p``. The default
+        implementation folds with ``And`` via ``fold_map`` and stops the fold
+        there, so only ``fold_map`` or ``foldl`` of the instance is used.
+
+        """
+        from haskpy.types.monoids import And
+        return _escape_fold(
+            lambda stop: self.fold_map(
+                And,
+                lambda x: And(True) if p(x) else stop(False),
+            ).boolean
+        )
+
+    def find(self, p):
+        """t a -> (a -> bool) -> Maybe a
+
+        Return the first value that satisfies ``p`` or ``Nothing``. The default
+        implementation stops ``foldl`` at the first such value.
+
+        """
+        from haskpy.types.maybe import Just, Nothing
+
+        def fold(stop):
+            self.foldl(lambda _, x: stop(Just(x)) if p(x) else None, None)
+            return Nothing
+
+        return _escape_fold(fold)
+
     def fold(self, monoid):
         return self.fold_map(monoid, identity)
 
@@ -152,15 +298,16 @@ class Foldable(Type):
         methods (e.g., sum, elem) even for large or sometimes infinite
         foldables.
 
-        The default implementation isn't very efficient as it uses folding to
-        construct the iterator.
+        The default implementation collects the values into a list with
+        ``foldl`` and iterates over it. That takes linear time, but the values
+        are collected eagerly, so it doesn't work for infinite foldables and
+        takes linear memory.
 
         """
         warn("Using default implementation of to_iter", PerformanceWarning)
-        return self.foldl(
-            lambda acc, x: itertools.chain(acc, (x,)),
-            itertools.chain()
-        )
+        xs = []
+        self.foldl(lambda _, x: xs.append(x), None)
+        return iter(xs)
 
     def length(self):
         """t a -> int
@@ -229,7 +376,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_fold_map(cls, data):
         # Draw types
         from haskpy.typeclasses import Monoid
@@ -257,7 +404,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_foldr(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -277,6 +424,40 @@ class Foldable(Type):
 
         return
 
+    @class_function
+    @assert_output
+    def assert_foldable_foldr_lazy(cls, xs, combine, initial):
+        # Strict combiner gives the same result as foldr
+        from haskpy.functions import foldr_lazy
+        lazy_combine = lambda x, rest: rest.map(lambda acc: combine(x, acc))
+        return (
+            Foldable.foldr_lazy(xs, lazy_combine, initial),
+            xs.foldr_lazy(lazy_combine, initial),
+            foldr_lazy(lazy_combine, initial, xs),
+            xs.foldr(combine, initial),
+        )
+
+    @class_function
+    @given(st.data)
+    def test_foldable_foldr_lazy(cls, data):
+        # Draw types
+        a = data.draw(testing.sample_hashable_type())
+        b = data.draw(testing.sample_hashable_type())
+
+        # Draw values
+        xs = data.draw(cls.sample_foldable_value(a))
+        g = data.draw(testing.sample_function(testing.sample_function(b)))
+        initial = data.draw(b)
+
+        # Uncurry the function
+        f = lambda x, y: g(x)(y)
+
+        with catch_warnings():
+            filterwarnings("ignore", category=PerformanceWarning)
+            cls.assert_foldable_foldr_lazy(xs, f, initial, data=data)
+
+        return
+
     @class_function
     @assert_output
     def assert_foldable_foldl(cls, xs, combine, initial):
@@ -290,7 +471,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_foldl(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -310,6 +491,106 @@ class Foldable(Type):
 
         return
 
+    @class_function
+    @assert_output
+    def assert_foldable_fold_until(cls, xs, combine, initial, limit):
+        # The fold stops at the first accumulator that is larger than the limit
+        from haskpy.functions import fold_until
+        from haskpy.types.either import Left, Right
+
+        def step(acc, x):
+            acc = combine(acc, x)
+            return Left(acc) if acc > limit else Right(acc)
+
+        def expected():
+            acc = initial
+            for x in xs.to_iter():
+                acc = combine(acc, x)
+                if acc > limit:
+                    return Left(acc)
+            return Right(acc)
+
+        return (
+            expected(),
+            Foldable.fold_until(xs, step, initial),
+            xs.fold_until(step, initial),
+            fold_until(step, initial, xs),
+        )
+
+    @class_function
+    @given(st.data)
+    def test_foldable_fold_until(cls, data):
+        # Draw values
+        xs = data.draw(cls.sample_foldable_value(st.integers()))
+        initial = data.draw(st.integers())
+        limit = data.draw(st.integers())
+
+        with catch_warnings():
+            filterwarnings("ignore", category=PerformanceWarning)
+            cls.assert_foldable_fold_until(
+                xs,
+                lambda acc, x: acc + x,
+                initial,
+                limit,
+                data=data,
+            )
+
+        return
+
+    @class_function
+    @assert_output
+    def assert_foldable_any(cls, xs, p):
+        # The default implementation defines the law (with respect to other
+        # methods)
+        from haskpy.functions import any
+        return (
+            Foldable.any(xs, p),
+            xs.any(p),
+            any(p, xs),
+        )
+
+    @class_function
+    @assert_output
+    def assert_foldable_all(cls, xs, p):
+        # The default implementation defines the law (with respect to other
+        # methods)
+        from haskpy.functions import all
+        return (
+            Foldable.all(xs, p),
+            xs.all(p),
+            all(p, xs),
+        )
+
+    @class_function
+    @assert_output
+    def assert_foldable_find(cls, xs, p):
+        # The default implementation defines the law (with respect to other
+        # methods)
+        from haskpy.functions import find
+        return (
+            Foldable.find(xs, p),
+            xs.find(p),
+            find(p, xs),
+        )
+
+    @class_function
+    @given(st.data)
+    def test_foldable_any_all_find(cls, data):
+        # Draw types
+        a = data.draw(testing.sample_hashable_type())
+
+        # Draw values
+        xs = data.draw(cls.sample_foldable_value(a))
+        p = data.draw(testing.sample_function(st.booleans()))
+
+        with catch_warnings():
+            filterwarnings("ignore", category=PerformanceWarning)
+            cls.assert_foldable_any(xs, p, data=data)
+            cls.assert_foldable_all(xs, p, data=data)
+            cls.assert_foldable_find(xs, p, data=data)
+
+        return
+
     @class_function
     @assert_output
     def assert_foldable_fold(cls, xs, monoid):
@@ -323,7 +604,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_fold(cls, data):
         # Draw types
         from haskpy.typeclasses import Monoid
@@ -349,7 +630,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_length(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -376,7 +657,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_null(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -403,7 +684,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_sum(cls, data):
         # Draw values
         xs = data.draw(cls.sample_foldable_value(st.integers()))
@@ -427,7 +708,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_elem(cls, data):
         # Draw types
         a = data.draw(testing.sample_eq_type())
@@ -456,7 +737,7 @@ class Foldable(Type):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_foldable_functor(cls, data):
         # Draw types
         from haskpy.typeclasses import Monoid
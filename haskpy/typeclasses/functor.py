@@ -1,8 +1,5 @@
-from hypothesis import given
-from hypothesis import strategies as st
-
 from .typeclass import Type
-from haskpy.utils import identity, assert_output
+from haskpy.utils import identity, assert_output, st, given
 from haskpy import testing
 from haskpy import utils
 
@@ -10,6 +7,8 @@ from haskpy import utils
 class Functor(Type):
     """Covariant functor"""
 
+    __slots__ = ()
+
     @utils.abstract_function
     def map(self, f):
         """Haskell fmap"""
@@ -71,7 +70,7 @@ class Functor(Type):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_functor_identity(cls, data):
         t = data.draw(cls.sample_type())
         cls.assert_functor_identity(
@@ -89,7 +88,7 @@ class Functor(Type):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_functor_composition(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -118,7 +117,7 @@ class Functor(Type):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_functor_map(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -142,7 +141,7 @@ class Functor(Type):
         )
 
     @utils.class_function
-    @given(st.data())
+    @given(st.data)
     def test_functor_replace(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -4,6 +4,8 @@ from haskpy.utils import class_function
 
 class Hashable(Type):
 
+    __slots__ = ()
+
     @class_function
     def sample_hashable_type(cls):
         return cls.sample_type()
@@ -1,8 +1,5 @@
-import hypothesis.strategies as st
-from hypothesis import given
-
 from .applicative import Applicative
-from haskpy.utils import identity, assert_output, class_function
+from haskpy.utils import identity, assert_output, class_function, st, given
 from haskpy import testing
 
 
@@ -22,6 +19,8 @@ class Monad(Applicative):
 
     """
 
+    __slots__ = ()
+
     def bind(self, f):
         """m a -> (a -> m b) -> m b
 
@@ -119,7 +118,7 @@ class Monad(Applicative):
         return (f(a), cls.pure(a).bind(f))
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_left_identity(cls, data):
         # Draw types
         ta = data.draw(testing.sample_hashable_type())
@@ -138,7 +137,7 @@ class Monad(Applicative):
         return (m, m.bind(cls.pure))
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_right_identity(cls, data):
         # Draw types
         a = data.draw(testing.sample_type())
@@ -158,7 +157,7 @@ class Monad(Applicative):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_associativity(cls, data):
         a = data.draw(testing.sample_hashable_type())
         b = data.draw(testing.sample_hashable_type())
@@ -186,7 +185,7 @@ class Monad(Applicative):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_bind(cls, data):
         """Test consistency of ``bind`` with the default implementation"""
         # Draw types
@@ -211,7 +210,7 @@ class Monad(Applicative):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_join(cls, data):
         """Test consistency of ``join`` with the default implementation"""
         # Draw types
@@ -232,7 +231,7 @@ class Monad(Applicative):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_map(cls, data):
         """Test consistency of ``map`` with the default implementation"""
         # Draw types
@@ -254,7 +253,7 @@ class Monad(Applicative):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monad_apply(cls, data):
         """Test consistency ``apply`` with the default implementations"""
         # Draw types
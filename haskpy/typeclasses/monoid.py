@@ -1,7 +1,11 @@
-from hypothesis import given
-import hypothesis.strategies as st
-
-from haskpy.utils import assert_output, class_function, abstract_class_property
+from haskpy.utils import (
+    st,
+    given,
+    assert_output,
+    class_function,
+    abstract_class_property,
+    reduce_balanced,
+)
 from .semigroup import Semigroup, Commutative
 
 
@@ -14,12 +18,27 @@ class Monoid(Semigroup):
 
     - ``append``
 
+    If the values can be combined in bulk faster than by appending them one
+    by one, also ``mconcat`` should be implemented. Folds use it.
+
     """
 
+    __slots__ = ()
+
     @abstract_class_property
     def empty(cls):
         """Identity element for the monoid"""
 
+    @class_function
+    def mconcat(cls, xs):
+        """Iterable m -> m
+
+        Combine the monoid values of an iterable. The default implementation
+        appends them in a balanced tree (see ``haskpy.utils.reduce_balanced``).
+
+        """
+        return reduce_balanced(lambda x, y: x.append(y), xs, cls.empty)
+
     #
     # Sampling methods for property tests
     #
@@ -40,7 +59,7 @@ class Monoid(Semigroup):
     #
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_monoid_identity(cls, data):
         """Test monoid identity law"""
         # Draw types
@@ -61,6 +80,34 @@ class Monoid(Semigroup):
             cls.empty.append(x),
         )
 
+    @class_function
+    @given(st.data)
+    def test_monoid_mconcat(cls, data):
+        """Test that mconcat is consistent with append"""
+        # Draw types
+        t = data.draw(cls.sample_monoid_type())
+
+        # Draw values
+        xs = data.draw(st.lists(t, max_size=5))
+
+        cls.assert_monoid_mconcat(xs, data=data)
+        return
+
+    @class_function
+    @assert_output
+    def assert_monoid_mconcat(cls, xs):
+        from haskpy.functions import mconcat
+        m = cls.empty
+        for x in xs:
+            m = m.append(x)
+        return (
+            m,
+            cls.mconcat(xs),
+            cls.mconcat(iter(xs)),
+            Monoid.mconcat.__func__(cls, xs),
+            mconcat(cls, xs),
+        )
+
 
 class CommutativeMonoid(Commutative, Monoid):
     """Monoid following the commutativity law
@@ -72,7 +119,8 @@ class CommutativeMonoid(Commutative, Monoid):
     - ``append``
 
     """
-    pass
+
+    __slots__ = ()
 
 
 # Monoid-related functions are defined in function module because of circular
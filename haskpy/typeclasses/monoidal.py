@@ -1,9 +1,7 @@
 import attr
-from hypothesis import given
-from hypothesis import strategies as st
 
 from .profunctor import Profunctor
-from haskpy.utils import identity, assert_output
+from haskpy.utils import identity, assert_output, st, given
 from haskpy import testing
 
 
@@ -26,7 +24,7 @@ class _MonoidalMeta(type(Profunctor)):
     #     )
 
 
-    # @given(st.data())
+    # @given(st.data)
     # def test_cartesian_identity(cls, data):
     #     # Draw types
     #     a = data.draw(testing.sample_hashable_type())
@@ -53,7 +51,7 @@ class _MonoidalMeta(type(Profunctor)):
     #     )
 
 
-    # @given(st.data())
+    # @given(st.data)
     # def test_cartesian_associativity(cls, data):
     #     # Draw types
     #     a = data.draw(
@@ -87,7 +85,7 @@ class _MonoidalMeta(type(Profunctor)):
     #     )
 
 
-    # @given(st.data())
+    # @given(st.data)
     # def test_cartesian_first(cls, data):
     #     # Draw types
     #     a1 = data.draw(testing.sample_hashable_type())
@@ -113,7 +111,7 @@ class _MonoidalMeta(type(Profunctor)):
     #     )
 
 
-    # @given(st.data())
+    # @given(st.data)
     # def test_cartesian_second(cls, data):
     #     # Draw types
     #     a1 = data.draw(testing.sample_hashable_type())
@@ -139,6 +137,7 @@ class Monoidal(Profunctor, metaclass=_MonoidalMeta):
 
     """
 
+    __slots__ = ()
 
     def par(self, p):
         """p a b -> p c d -> p (a, b) (c, d)
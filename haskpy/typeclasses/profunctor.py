@@ -1,9 +1,6 @@
-from hypothesis import given
-from hypothesis import strategies as st
-
 from .contravariant import Contravariant
 from .functor import Functor
-from haskpy.utils import identity, assert_output, class_function
+from haskpy.utils import identity, assert_output, class_function, st, given, composite
 from haskpy import testing
 
 
@@ -17,6 +14,8 @@ class Profunctor(Functor, Contravariant):
 
     """
 
+    __slots__ = ()
+
     def dimap(self, f, g):
         """p b c -> (a -> b) -> (c -> d) -> p a d"""
         return self.contramap(f).map(g)
@@ -44,13 +43,13 @@ class Profunctor(Functor, Contravariant):
         return cls.sample_value(a, b)
 
     @class_function
-    @st.composite
+    @composite
     def sample_contravariant_value(draw, cls, a):
         b = draw(testing.sample_type())
         return draw(cls.sample_profunctor_value(a, b))
 
     @class_function
-    @st.composite
+    @composite
     def sample_functor_value(draw, cls, b):
         a = draw(testing.sample_type())
         return draw(cls.sample_profunctor_value(a, b))
@@ -68,7 +67,7 @@ class Profunctor(Functor, Contravariant):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_profunctor_identity(cls, data):
         # Draw types
         a = data.draw(testing.sample_hashable_type())
@@ -95,7 +94,7 @@ class Profunctor(Functor, Contravariant):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_profunctor_dimap(cls, data):
         # Draw types
         b = data.draw(testing.sample_hashable_type())
@@ -119,7 +118,7 @@ class Profunctor(Functor, Contravariant):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_profunctor_map(cls, data):
         # Draw types
         b = data.draw(testing.sample_hashable_type())
@@ -142,7 +141,7 @@ class Profunctor(Functor, Contravariant):
         )
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_profunctor_contramap(cls, data):
         # Draw types
         b = data.draw(testing.sample_hashable_type())
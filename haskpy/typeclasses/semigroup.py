@@ -1,8 +1,5 @@
-import hypothesis.strategies as st
-from hypothesis import given
-
 from .typeclass import Type
-from haskpy.utils import assert_output, class_function, abstract_function
+from haskpy.utils import assert_output, class_function, abstract_function, st, given
 
 
 class Semigroup(Type):
@@ -14,6 +11,8 @@ class Semigroup(Type):
 
     """
 
+    __slots__ = ()
+
     @abstract_function
     def append(self, x):
         """m -> m -> m"""
@@ -33,7 +32,7 @@ class Semigroup(Type):
     #
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_semigroup_associativity(cls, data):
         """Test semigroup associativity law"""
         # Draw types
@@ -69,6 +68,8 @@ class Commutative(Semigroup):
 
     """
 
+    __slots__ = ()
+
     #
     # Sampling methods for property tests
     #
@@ -90,7 +91,7 @@ class Commutative(Semigroup):
         return (x.append(y), y.append(x))
 
     @class_function
-    @given(st.data())
+    @given(st.data)
     def test_commutative_commutativity(cls, data):
         # Draw types
         t = data.draw(cls.sample_commutative_type())
@@ -1,8 +1,24 @@
+import inspect
+
 from haskpy import utils
 
 
 class MetaType(type):
 
+    def __init__(cls, name, bases, dct, **kwargs):
+        super().__init__(name, bases, dct, **kwargs)
+        # Resolve the hidden methods once when the class is created instead of
+        # checking every attribute access on the instances
+        cls.__nonexisting__ = frozenset(
+            name
+            for name in dir(cls)
+            if isinstance(
+                inspect.getattr_static(cls, name),
+                utils.nonexisting_function,
+            )
+        )
+        return
+
     def __repr__(cls):
         return cls.__name__
 
@@ -10,12 +26,15 @@ class MetaType(type):
 class Type(object, metaclass=MetaType):
     """Foo"""
 
+    __slots__ = ()
+
     def __dir__(self):
         xs = super().__dir__()
+        hidden = type(self).__nonexisting__
         return [
             x
             for x in xs
-            if hasattr(self, x)
+            if x not in hidden and hasattr(self, x)
         ]
 
     @utils.nonexisting_function
@@ -57,10 +76,3 @@ class Type(object, metaclass=MetaType):
     @utils.nonexisting_function
     def __hash__(self, other):
         pass
-
-    def __getattribute__(self, name):
-        attr = super().__getattribute__(name)
-        if isinstance(attr, utils.nonexisting_function):
-            raise AttributeError()
-        else:
-            return attr
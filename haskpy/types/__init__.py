@@ -9,6 +9,35 @@
 from .maybe import Maybe, Just, Nothing, MaybeT
 from .either import Either, Left, Right
 from .list import List
+from .seq import Seq
+from .linkedlist import LinkedList
+from .stream import Stream
 from .identity import Identity, IdentityT
 from .compose import Compose
 from .monoids import Sum, And, Or, String, Endo
+from .trampoline import Trampoline, Done, Suspend
+
+__all__ = [
+    "And",
+    "Compose",
+    "Done",
+    "Either",
+    "Endo",
+    "Identity",
+    "IdentityT",
+    "Just",
+    "Left",
+    "LinkedList",
+    "List",
+    "Maybe",
+    "MaybeT",
+    "Nothing",
+    "Or",
+    "Right",
+    "Seq",
+    "Stream",
+    "String",
+    "Sum",
+    "Suspend",
+    "Trampoline",
+]
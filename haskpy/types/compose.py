@@ -3,9 +3,10 @@ import functools
 
 from haskpy.typeclasses import Applicative, Eq
 from haskpy.functions import map, apply
-from haskpy.utils import class_function, immutable, eq_test
+from haskpy.utils import class_function, immutable, eq_test, type_constructor
 
 
+@type_constructor
 def Compose(X, Y):
     """Compose two type constructors X and Y into a single type constructor
 
@@ -1,8 +1,7 @@
 import attr
-import hypothesis.strategies as st
 
 from haskpy.typeclasses import Monad, Eq
-from haskpy.utils import class_function, immutable, eq_test
+from haskpy.utils import class_function, immutable, eq_test, st, composite
 
 from haskpy import testing
 
@@ -22,7 +21,7 @@ class Either(Monad, Eq):
         return st.one_of(a.map(Left), b.map(Right))
 
     @class_function
-    @st.composite
+    @composite
     def sample_functor_value(draw, cls, b):
         a = draw(testing.sample_type())
         return draw(cls.sample_value(a, b))
@@ -1,6 +1,6 @@
 import attr
 
-from haskpy.utils import class_function, immutable, eq_test
+from haskpy.utils import class_function, immutable, eq_test, type_constructor
 from haskpy.typeclasses import Monad, Eq
 
 
@@ -32,6 +32,7 @@ class Identity(Monad, Eq):
         return eq_test(self.x, other.x, data)
 
 
+@type_constructor
 def IdentityT(M):
 
     class MetaIdentityM(type(Monad)):
@@ -0,0 +1,221 @@
+"""Immutable singly-linked list
+
+LinkedList is built from cons cells. Adding a value to the beginning creates
+one new cell that points to the existing cells, so ``cons``, ``head`` and
+``tail`` take constant time and the tails are shared between lists instead of
+copied. That makes it suitable for accumulating values by repeated prepending,
+which takes linear time per prepend with the tuple-based List.
+
+All traversals (folds, equality, iteration and representation) walk the cells
+in a loop, so long lists don't hit the recursion limit.
+
+"""
+
+import attr
+import functools
+import itertools
+
+from haskpy.typeclasses import Monad, Monoid, Foldable, Eq
+from haskpy import testing
+from haskpy.utils import (
+    st,
+    immutable,
+    class_property,
+    class_function,
+    eq_test,
+)
+
+
+class _Cell():
+    """Cons cell: a value, the next cell (or None) and the length"""
+
+    __slots__ = ("head", "tail", "size")
+
+    def __init__(self, head, tail):
+        self.head = head
+        self.tail = tail
+        self.size = 1 if tail is None else tail.size + 1
+        return
+
+
+def _iter_cells(cell):
+    while cell is not None:
+        yield cell.head
+        cell = cell.tail
+
+
+def _prepend_all(xs, cell):
+    """Prepend the values of a reversible sequence to the cells"""
+    for x in reversed(xs):
+        cell = _Cell(x, cell)
+    return cell
+
+
+@immutable(init=False)
+class LinkedList(Monad, Monoid, Foldable, Eq):
+    """Immutable singly-linked list with shared tails"""
+
+    __cell = attr.ib()
+
+    def __init__(self, *xs):
+        object.__setattr__(self, "_LinkedList__cell", _prepend_all(xs, None))
+        return
+
+    def cons(self, x):
+        """LinkedList a -> a -> LinkedList a
+
+        Add a value to the beginning in constant time. The result shares the
+        cells of this list.
+
+        """
+        return _from_cell(_Cell(x, self.__cell))
+
+    def head(self):
+        """LinkedList a -> a
+
+        Return the first value. Raises IndexError if the list is empty.
+
+        """
+        if self.__cell is None:
+            raise IndexError("Empty list")
+        return self.__cell.head
+
+    def tail(self):
+        """LinkedList a -> LinkedList a
+
+        Return the list without the first value in constant time. Raises
+        IndexError if the list is empty.
+
+        """
+        if self.__cell is None:
+            raise IndexError("Empty list")
+        return _from_cell(self.__cell.tail)
+
+    def map(self, f):
+        """LinkedList a -> (a -> b) -> LinkedList b"""
+        return LinkedList.from_iter(map(f, self.to_iter()))
+
+    @class_function
+    def pure(cls, x):
+        """a -> LinkedList a"""
+        return _from_cell(_Cell(x, None))
+
+    def apply(self, fs):
+        """LinkedList a -> LinkedList (a -> b) -> LinkedList b"""
+        return LinkedList.from_iter(
+            f(x) for (f, x) in itertools.product(fs.to_iter(), self.to_iter())
+        )
+
+    def bind(self, f):
+        """LinkedList a -> (a -> LinkedList b) -> LinkedList b"""
+        return LinkedList.from_iter(
+            itertools.chain.from_iterable(
+                f(x).to_iter() for x in self.to_iter()
+            )
+        )
+
+    def __eq__(self, other):
+        """LinkedList a -> LinkedList a -> bool"""
+        (xs, ys) = (self.__cell, other.__cell)
+        if self.length() != other.length():
+            return False
+        while xs is not ys:
+            if not (xs.head == ys.head):
+                return False
+            (xs, ys) = (xs.tail, ys.tail)
+        # Either both ended or the rest is shared
+        return True
+
+    @class_property
+    def empty(cls):
+        """Empty list, type ``LinkedList a``"""
+        return _from_cell(None)
+
+    def append(self, xs):
+        """LinkedList a -> LinkedList a -> LinkedList a
+
+        Copies the cells of this list and shares the cells of ``xs``.
+
+        """
+        if xs.__cell is None:
+            return self
+        return _from_cell(
+            _prepend_all(tuple(self.to_iter()), xs.__cell)
+        )
+
+    def to_iter(self):
+        return _iter_cells(self.__cell)
+
+    def __iter__(self):
+        return _iter_cells(self.__cell)
+
+    @class_function
+    def from_iter(cls, xs):
+        """Iterable f => f a -> LinkedList a"""
+        return _from_cell(_prepend_all(tuple(xs), None))
+
+    def length(self):
+        return 0 if self.__cell is None else self.__cell.size
+
+    def null(self):
+        return self.__cell is None
+
+    def foldl(self, combine, initial):
+        """LinkedList a -> (b -> a -> b) -> b -> b"""
+        return functools.reduce(combine, self.to_iter(), initial)
+
+    def foldr(self, combine, initial):
+        """LinkedList a -> (a -> b -> b) -> b -> b"""
+        acc = initial
+        for x in reversed(tuple(self.to_iter())):
+            acc = combine(x, acc)
+        return acc
+
+    def __repr__(self):
+        return "LinkedList({})".format(
+            ", ".join(repr(x) for x in self.to_iter())
+        )
+
+    #
+    # Sampling methods for property tests
+    #
+
+    @class_function
+    def sample_value(cls, a):
+        # Prepend to a few lists so that some tails are shared
+        return st.tuples(
+            st.lists(a, max_size=5),
+            st.lists(a, max_size=5),
+        ).map(
+            lambda xsys: functools.reduce(
+                LinkedList.cons,
+                xsys[0],
+                cls.from_iter(xsys[1]),
+            )
+        )
+
+    @class_function
+    def sample_monoid_type(cls):
+        t = testing.sample_type()
+        return t.map(cls.sample_value)
+
+    @class_function
+    def sample_eq_type(cls):
+        t = testing.sample_eq_type()
+        return t.map(cls.sample_value)
+
+    def __eq_test__(self, other, data=None):
+        return (
+            False if self.length() != other.length() else
+            all(
+                eq_test(x, y, data)
+                for (x, y) in zip(self.to_iter(), other.to_iter())
+            )
+        )
+
+
+def _from_cell(cell):
+    """Create LinkedList that uses the given cell as its first cell"""
+    xs = object.__new__(LinkedList)
+    object.__setattr__(xs, "_LinkedList__cell", cell)
+    return xs
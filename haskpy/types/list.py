@@ -1,16 +1,18 @@
 import attr
+import concurrent.futures
 import functools
-from hypothesis import strategies as st
+import itertools
+import os
 
-from haskpy.typeclasses import Monad, Monoid, Foldable, Eq
+from haskpy.typeclasses import Monad, Monoid, Foldable, Eq, Commutative
 from haskpy import testing
 from haskpy.utils import (
+    st,
     immutable,
     class_property,
     class_function,
     eq_test,
 )
-from haskpy.functions import curry
 
 
 @immutable(init=False)
@@ -19,25 +21,42 @@ class List(Monad, Monoid, Foldable, Eq):
     __xs = attr.ib(converter=tuple)
 
     def __init__(self, *xs):
-        object.__setattr__(self, "_List__xs", tuple(xs))
+        # The arguments are already in a tuple, so no need to copy them
+        object.__setattr__(self, "_List__xs", xs)
         return
 
     def map(self, f):
         """List a -> (a -> b) -> List b"""
-        return List(*(f(x) for x in self.__xs))
+        return _from_tuple(tuple(map(f, self.__xs)))
 
     @class_function
     def pure(cls, x):
         """a -> List a"""
-        return cls(x)
+        return _from_tuple((x,), cls)
 
     def apply(self, fs):
         """List a -> List (a -> b) -> List b"""
-        return List(*(y for f in fs.__xs for y in self.map(f).__xs))
+        # Single pass over the cartesian product without intermediate lists
+        return _from_tuple(
+            tuple(f(x) for (f, x) in itertools.product(fs.__xs, self.__xs))
+        )
 
     def bind(self, f):
         """List a -> (a -> List b) -> List b"""
-        return List(*(y for ys in self.map(f).__xs for y in ys.__xs))
+        return _from_tuple(
+            tuple(itertools.chain.from_iterable(
+                f(x).__xs for x in self.__xs
+            ))
+        )
+
+    def product(self, ys):
+        """List a -> List b -> List (a, b)
+
+        Cartesian product of the lists. This is the same as ``liftA2(lambda x:
+        lambda y: (x, y), self, ys)`` but faster.
+
+        """
+        return _from_tuple(tuple(itertools.product(self.__xs, ys.__xs)))
 
     def __eq__(self, other):
         """List a -> List a -> bool"""
@@ -46,19 +65,36 @@ class List(Monad, Monoid, Foldable, Eq):
     @class_property
     def empty(cls):
         """Empty list, type ``List a``"""
-        return cls()
+        return _from_tuple((), cls)
 
     def append(self, xs):
         """List a -> List a -> List a"""
-        return List(*self.__xs, *xs.__xs)
+        return _from_tuple(self.__xs + xs.__xs)
+
+    @class_function
+    def mconcat(cls, xss):
+        """Iterable (List a) -> List a
+
+        Concatenate the lists in one pass in linear time.
+
+        """
+        return _from_tuple(
+            tuple(itertools.chain.from_iterable(xs.__xs for xs in xss)),
+            cls,
+        )
 
     def to_iter(self):
         yield from self.__xs
 
     @class_function
     def from_iter(cls, xs):
-        """Iterable f => f a -> List a"""
-        return cls(*xs)
+        """Iterable f => f a -> List a
+
+        The values are collected directly into the storage tuple of the list
+        without unpacking them as arguments. A tuple is used as it is.
+
+        """
+        return _from_tuple(tuple(xs), cls)
 
     def length(self):
         return len(self.__xs)
@@ -66,27 +102,50 @@ class List(Monad, Monoid, Foldable, Eq):
     def elem(self, e):
         return e in self.__xs
 
+    def fold_map(self, monoid, f, executor=None, chunksize=None):
+        """Monoid m => List a -> (a -> m) -> m (ignoring ``monoid`` argument)
+
+        If ``executor`` (a ``concurrent.futures.Executor``) is given, the list
+        is split into chunks of ``chunksize`` values and each chunk is folded
+        in the executor. That's possible because monoids are associative. The
+        chunk results are combined in order, or in the order they finish if
+        ``monoid`` is commutative. With a process pool, ``f`` and the values
+        must be picklable.
+
+        By default, the chunk size is chosen so that there are four chunks per
+        CPU. Raises ValueError if ``chunksize`` is less than one.
+
+        """
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(
+                "chunksize must be at least 1, got {}".format(chunksize)
+            )
+        if executor is None:
+            return _fold_chunk(monoid, f, self.__xs)
+        xs = self.__xs
+        if chunksize is None:
+            chunksize = max(-(-len(xs) // (4 * (os.cpu_count() or 1))), 1)
+        futures = [
+            executor.submit(_fold_chunk, monoid, f, xs[i:i + chunksize])
+            for i in range(0, len(xs), chunksize)
+        ]
+        if issubclass(monoid, Commutative):
+            futures = concurrent.futures.as_completed(futures)
+        return monoid.mconcat(future.result() for future in futures)
+
     def foldl(self, combine, initial):
         """List a -> (b -> a -> b) -> b -> b"""
-        # TODO: We could implement also fold_map to make fold_map and fold to
-        # use parallelized implementation because they use monoids. Now, the
-        # default implementations use foldl/foldr which both are sequential.
-        return functools.reduce(
-            lambda a, b: curry(combine)(a)(b),
-            self.__xs,
-            initial,
-        )
+        # NOTE: combine is called as a binary function similarly as in the
+        # other Foldable instances. Currying it for each element would cost
+        # much more than the actual reduction.
+        return functools.reduce(combine, self.__xs, initial)
 
     def foldr(self, combine, initial):
         """List a -> (a -> b -> b) -> b -> b"""
-        # TODO: We could implement also fold_map to make fold_map and fold to
-        # use parallelized implementation because they use monoids. Now, the
-        # default implementations use foldl/foldr which both are sequential.
-        return functools.reduce(
-            lambda b, a: curry(combine)(a)(b),
-            self.__xs[::-1],
-            initial,
-        )
+        acc = initial
+        for x in reversed(self.__xs):
+            acc = combine(x, acc)
+        return acc
 
     def __repr__(self):
         return "List{}".format(repr(self.__xs))
@@ -97,7 +156,7 @@ class List(Monad, Monoid, Foldable, Eq):
 
     @class_function
     def sample_value(cls, a):
-        return st.lists(a, max_size=10).map(lambda xs: cls(*xs))
+        return st.lists(a, max_size=10).map(cls.from_iter)
 
     @class_function
     def sample_monoid_type(cls):
@@ -117,3 +176,23 @@ class List(Monad, Monoid, Foldable, Eq):
                 for (x, y) in zip(self.__xs, other.__xs)
             )
         )
+
+
+def _fold_chunk(monoid, f, xs):
+    """Fold a tuple of values with ``mconcat`` of the monoid
+
+    This is a module-level function so that process pools can pickle it.
+
+    """
+    return monoid.mconcat(f(x) for x in xs)
+
+
+def _from_tuple(xs, cls=List):
+    """Create List that uses the given tuple as its storage without copying
+
+    ``cls`` can be a subclass of List. Its ``__init__`` isn't called.
+
+    """
+    xs_list = object.__new__(cls)
+    object.__setattr__(xs_list, "_List__xs", xs)
+    return xs_list
@@ -1,5 +1,4 @@
 import attr
-import hypothesis.strategies as st
 
 from haskpy.typeclasses import (
     Monad,
@@ -9,12 +8,15 @@ from haskpy.typeclasses import (
     Eq,
 )
 from haskpy.utils import (
+    st,
     singleton,
     immutable,
     class_function,
     class_property,
     eq_test,
+    type_constructor,
 )
+from haskpy.types.either import Right
 
 from haskpy import testing
 
@@ -36,6 +38,8 @@ class Maybe(
 ):
     """Maybe type for optional values"""
 
+    __slots__ = ()
+
     def match(self, *, Just, Nothing):
         raise NotImplementedError()
 
@@ -72,13 +76,11 @@ class Maybe(
         return t.map(cls.sample_value)
 
 
+@immutable
 class Just(Maybe):
 
     __x = attr.ib()
 
-    def __init__(self, x):
-        self.__x = x
-
     def match(self, *, Just, Nothing):
         return Just(self.__x)
 
@@ -106,6 +108,18 @@ class Just(Maybe):
     def foldr(self, combine, initial):
         return combine(self.__x, initial)
 
+    def fold_until(self, combine, initial):
+        return combine(initial, self.__x)
+
+    def any(self, p):
+        return bool(p(self.__x))
+
+    def all(self, p):
+        return bool(p(self.__x))
+
+    def find(self, p):
+        return self if p(self.__x) else Nothing
+
     def length(self):
         return 1
 
@@ -156,6 +170,18 @@ class Nothing(Maybe):
     def foldr(self, combine, initial):
         return initial
 
+    def fold_until(self, combine, initial):
+        return Right(initial)
+
+    def any(self, p):
+        return False
+
+    def all(self, p):
+        return True
+
+    def find(self, p):
+        return Nothing
+
     def length(self):
         return 0
 
@@ -172,6 +198,7 @@ class Nothing(Maybe):
         return other.match(Just=lambda _: False, Nothing=lambda: True)
 
 
+@type_constructor
 def MaybeT(M):
     """m (Maybe a) -> MaybeT m a"""
 
@@ -1,12 +1,13 @@
 """A collection of useful simple monoids"""
 
 import attr
-import hypothesis.strategies as st
+import builtins
+import threading
 
 from haskpy.typeclasses import Monoid, CommutativeMonoid, Hashable, Eq
 from haskpy import testing
 from haskpy.utils import (
-    identity,
+    st,
     class_property,
     class_function,
     immutable,
@@ -26,6 +27,10 @@ class Sum(CommutativeMonoid, Hashable, Eq):
     def append(self, x):
         return Sum(self.number + x.number)
 
+    @class_function
+    def mconcat(cls, xs):
+        return cls(builtins.sum(x.number for x in xs))
+
     def __eq__(self, other):
         return self.number == other.number
 
@@ -46,6 +51,11 @@ class And(CommutativeMonoid, Hashable, Eq):
     def append(self, x):
         return And(self.boolean and x.boolean)
 
+    @class_function
+    def mconcat(cls, xs):
+        # Stops at the first false value
+        return cls(all(x.boolean for x in xs))
+
     def __eq__(self, other):
         return self.boolean == other.boolean
 
@@ -66,6 +76,11 @@ class Or(CommutativeMonoid, Hashable, Eq):
     def append(self, x):
         return Or(self.boolean or x.boolean)
 
+    @class_function
+    def mconcat(cls, xs):
+        # Stops at the first true value
+        return cls(any(x.boolean for x in xs))
+
     def __eq__(self, other):
         return self.boolean == other.boolean
 
@@ -86,6 +101,10 @@ class String(Monoid, Hashable, Eq):
     def append(self, s):
         return String(self.string + s.string)
 
+    @class_function
+    def mconcat(cls, xs):
+        return cls("".join(x.string for x in xs))
+
     def __eq__(self, other):
         return self.string == other.string
 
@@ -100,24 +119,73 @@ class String(Monoid, Hashable, Eq):
         return st.just(st.text().map(lambda s: String(s)))
 
 
-@immutable
+# Two threads appending to the same Endo must not both extend its list
+_endo_lock = threading.Lock()
+
+
+@immutable(init=False)
 class Endo(Monoid):
-    """Endofunction monoid (a -> a)"""
+    """Endofunction monoid (a -> a)
+
+    The composed functions are kept in a flat list and applied in a loop, so
+    long compositions don't nest function calls and don't hit the recursion
+    limit. Appending extends the list in place when no other Endo has extended
+    it already, so appending single functions to a growing composition takes
+    amortized constant time. The ownership check and the extension are done
+    under a lock, so an Endo can be shared across threads.
+
+    """
 
-    app_endo = attr.ib()
+    # Functions in composition order, that is, the last function is applied
+    # first. The list may be shared with Endos which have been created by
+    # appending to this Endo, so only the first __n functions belong to this
+    # Endo.
+    __fs = attr.ib()
+    __n = attr.ib()
+
+    def __init__(self, app_endo):
+        object.__setattr__(self, "_Endo__fs", [app_endo])
+        object.__setattr__(self, "_Endo__n", 1)
+        return
 
     @class_property
     def empty(cls):
-        return cls(identity)
+        return _endo([], 0)
 
     def append(self, f):
         # Append by composing
-        return Endo(lambda a: self.app_endo(f.app_endo(a)))
+        fs = self.__fs
+        n = self.__n
+        gs = f.__fs[:f.__n]
+        with _endo_lock:
+            if len(fs) == n:
+                # This Endo owns the end of the list, so extend it in place
+                fs.extend(gs)
+            else:
+                fs = fs[:n] + gs
+        return _endo(fs, n + len(gs))
+
+    def app_endo(self, a):
+        """Apply the endofunction: ``Endo a -> a -> a``"""
+        fs = self.__fs
+        for i in range(self.__n - 1, -1, -1):
+            a = fs[i](a)
+        return a
 
     def __repr__(self):
-        return "Endo({})".format(self.app_endo)
+        fs = self.__fs[:self.__n]
+        return (
+            "Endo.empty" if len(fs) == 0 else
+            "Endo({})".format(fs[0]) + "".join(
+                ".append(Endo({}))".format(f) for f in fs[1:]
+            )
+        )
 
-    def __eq_test__(self, other, data, input_strategy=st.integers()):
+    def __eq_test__(self, other, data, input_strategy=None):
+        # The default strategy is created here so that Hypothesis isn't
+        # imported with HaskPy
+        if input_strategy is None:
+            input_strategy = st.integers()
         x = data.draw(input_strategy)
         return eq_test(self.app_endo(x), other.app_endo(x), data)
 
@@ -126,3 +194,11 @@ class Endo(Monoid):
         return testing.sample_hashable_type().map(
             lambda a: testing.sample_function(a).map(lambda f: Endo(f))
         )
+
+
+def _endo(fs, n):
+    """Create Endo from the first ``n`` functions in a list"""
+    endo = object.__new__(Endo)
+    object.__setattr__(endo, "_Endo__fs", fs)
+    object.__setattr__(endo, "_Endo__n", n)
+    return endo
@@ -0,0 +1,585 @@
+"""Persistent sequence based on a finger tree
+
+Seq is an immutable sequence similar to List, but instead of a tuple it stores
+the values in a 2-3 finger tree annotated with sizes (Hinze & Paterson: Finger
+trees: a simple general-purpose data structure, 2006). Thus:
+
+- adding or removing values at either end takes amortized constant time
+
+- concatenation takes logarithmic time
+
+- indexing and splitting take logarithmic time
+
+So building a sequence by monoidal accumulation (e.g., ``fold_map(Seq, f,
+xs)``) or by repeated appends takes linear time instead of quadratic.
+
+"""
+
+import attr
+import functools
+import itertools
+
+from haskpy.typeclasses import Monad, Monoid, Foldable, Eq
+from haskpy import testing
+from haskpy.utils import (
+    st,
+    immutable,
+    class_property,
+    class_function,
+    eq_test,
+)
+
+
+#
+# Finger tree
+#
+# The tree consists of levels. At the top level, the items are the values of
+# the sequence. At the next level, the items are 2-3 nodes of the values, then
+# 2-3 nodes of those nodes and so on. The functions below take a measure
+# function which gives the size (number of values) of an item at the current
+# level. Digits (the prefix and the suffix of a deep tree) are tuples of 1-4
+# items.
+#
+
+
+class _Node():
+    """2-3 node with its size cached"""
+
+    __slots__ = ("size", "items")
+
+    def __init__(self, size, items):
+        self.size = size
+        self.items = items
+
+
+class _Empty():
+    __slots__ = ()
+
+
+_EMPTY = _Empty()
+
+
+class _Single():
+    __slots__ = ("item",)
+
+    def __init__(self, item):
+        self.item = item
+
+
+class _Deep():
+    __slots__ = ("size", "prefix", "middle", "suffix")
+
+    def __init__(self, size, prefix, middle, suffix):
+        self.size = size
+        self.prefix = prefix
+        self.middle = middle
+        self.suffix = suffix
+
+
+def _value_size(x):
+    return 1
+
+
+def _node_size(node):
+    return node.size
+
+
+def _digit_size(digit, measure):
+    return sum(measure(x) for x in digit)
+
+
+def _tree_size(tree, measure):
+    return (
+        tree.size if isinstance(tree, _Deep) else
+        measure(tree.item) if isinstance(tree, _Single) else
+        0
+    )
+
+
+def _node(items, measure):
+    return _Node(_digit_size(items, measure), items)
+
+
+def _deep(prefix, middle, suffix, measure):
+    return _Deep(
+        (
+            _digit_size(prefix, measure) +
+            _tree_size(middle, _node_size) +
+            _digit_size(suffix, measure)
+        ),
+        prefix,
+        middle,
+        suffix,
+    )
+
+
+def _digit_to_tree(digit, measure):
+    tree = _EMPTY
+    for x in digit:
+        tree = _snoc(tree, x, measure)
+    return tree
+
+
+def _cons(x, tree, measure):
+    if isinstance(tree, _Empty):
+        return _Single(x)
+    if isinstance(tree, _Single):
+        return _Deep(
+            measure(x) + measure(tree.item),
+            (x,),
+            _EMPTY,
+            (tree.item,),
+        )
+    prefix = tree.prefix
+    if len(prefix) == 4:
+        # Push three items down to the middle as a node
+        return _Deep(
+            tree.size + measure(x),
+            (x, prefix[0]),
+            _cons(_node(prefix[1:], measure), tree.middle, _node_size),
+            tree.suffix,
+        )
+    return _Deep(tree.size + measure(x), (x,) + prefix, tree.middle, tree.suffix)
+
+
+def _snoc(tree, x, measure):
+    if isinstance(tree, _Empty):
+        return _Single(x)
+    if isinstance(tree, _Single):
+        return _Deep(
+            measure(tree.item) + measure(x),
+            (tree.item,),
+            _EMPTY,
+            (x,),
+        )
+    suffix = tree.suffix
+    if len(suffix) == 4:
+        # Push three items down to the middle as a node
+        return _Deep(
+            tree.size + measure(x),
+            tree.prefix,
+            _snoc(tree.middle, _node(suffix[:3], measure), _node_size),
+            (suffix[3], x),
+        )
+    return _Deep(tree.size + measure(x), tree.prefix, tree.middle, suffix + (x,))
+
+
+def _deep_left(prefix, middle, suffix, measure):
+    """Create a tree from a possibly empty prefix"""
+    if len(prefix) > 0:
+        return _deep(prefix, middle, suffix, measure)
+    view = _view_left(middle, _node_size)
+    if view is None:
+        return _digit_to_tree(suffix, measure)
+    (node, rest) = view
+    return _deep(node.items, rest, suffix, measure)
+
+
+def _deep_right(prefix, middle, suffix, measure):
+    """Create a tree from a possibly empty suffix"""
+    if len(suffix) > 0:
+        return _deep(prefix, middle, suffix, measure)
+    view = _view_right(middle, _node_size)
+    if view is None:
+        return _digit_to_tree(prefix, measure)
+    (rest, node) = view
+    return _deep(prefix, rest, node.items, measure)
+
+
+def _view_left(tree, measure):
+    """Return the first item and the rest of the tree, or None if empty"""
+    if isinstance(tree, _Empty):
+        return None
+    if isinstance(tree, _Single):
+        return (tree.item, _EMPTY)
+    return (
+        tree.prefix[0],
+        _deep_left(tree.prefix[1:], tree.middle, tree.suffix, measure),
+    )
+
+
+def _view_right(tree, measure):
+    """Return the beginning of the tree and the last item, or None if empty"""
+    if isinstance(tree, _Empty):
+        return None
+    if isinstance(tree, _Single):
+        return (_EMPTY, tree.item)
+    return (
+        _deep_right(tree.prefix, tree.middle, tree.suffix[:-1], measure),
+        tree.suffix[-1],
+    )
+
+
+def _nodes(items, measure):
+    """Group 2-12 items into 2-3 nodes"""
+    nodes = []
+    i = 0
+    n = len(items)
+    while n - i > 4:
+        nodes.append(_node(items[i:i + 3], measure))
+        i += 3
+    if n - i == 4:
+        nodes.append(_node(items[i:i + 2], measure))
+        nodes.append(_node(items[i + 2:], measure))
+    else:
+        nodes.append(_node(items[i:], measure))
+    return tuple(nodes)
+
+
+def _concat(left, middle, right, measure):
+    """Concatenate trees with a tuple of items between them"""
+    if isinstance(left, _Empty):
+        for x in reversed(middle):
+            right = _cons(x, right, measure)
+        return right
+    if isinstance(right, _Empty):
+        for x in middle:
+            left = _snoc(left, x, measure)
+        return left
+    if isinstance(left, _Single):
+        return _cons(left.item, _concat(_EMPTY, middle, right, measure), measure)
+    if isinstance(right, _Single):
+        return _snoc(_concat(left, middle, _EMPTY, measure), right.item, measure)
+    return _Deep(
+        left.size + _digit_size(middle, measure) + right.size,
+        left.prefix,
+        _concat(
+            left.middle,
+            _nodes(left.suffix + middle + right.prefix, measure),
+            right.middle,
+            _node_size,
+        ),
+        right.suffix,
+    )
+
+
+def _split_digit(digit, i, measure):
+    """Split a digit at the item containing index i"""
+    for (k, x) in enumerate(digit):
+        size = measure(x)
+        if i < size:
+            return (digit[:k], x, digit[k + 1:], i)
+        i -= size
+    raise IndexError("Index out of range")
+
+
+def _split_tree(tree, i, measure):
+    """Split a non-empty tree at the item containing index i
+
+    Returns the tree before the item, the item, the tree after the item and
+    the index within the item.
+
+    """
+    if isinstance(tree, _Single):
+        return (_EMPTY, tree.item, _EMPTY, i)
+    prefix_size = _digit_size(tree.prefix, measure)
+    if i < prefix_size:
+        (before, x, after, i) = _split_digit(tree.prefix, i, measure)
+        return (
+            _digit_to_tree(before, measure),
+            x,
+            _deep_left(after, tree.middle, tree.suffix, measure),
+            i,
+        )
+    i -= prefix_size
+    middle_size = _tree_size(tree.middle, _node_size)
+    if i < middle_size:
+        (left, node, right, i) = _split_tree(tree.middle, i, _node_size)
+        (before, x, after, i) = _split_digit(node.items, i, measure)
+        return (
+            _deep_right(tree.prefix, left, before, measure),
+            x,
+            _deep_left(after, right, tree.suffix, measure),
+            i,
+        )
+    (before, x, after, i) = _split_digit(tree.suffix, i - middle_size, measure)
+    return (
+        _deep_right(tree.prefix, tree.middle, before, measure),
+        x,
+        _digit_to_tree(after, measure),
+        i,
+    )
+
+
+def _lookup(tree, i, measure):
+    """Return the item containing index i and the index within the item"""
+    # Descend the spine of the tree until the digit containing the index is
+    # found. Each level deeper, the items are nested in one more level of
+    # nodes.
+    depth = 0
+    while True:
+        item_measure = measure if depth == 0 else _node_size
+        if isinstance(tree, _Single):
+            x = tree.item
+            break
+        prefix_size = _digit_size(tree.prefix, item_measure)
+        if i < prefix_size:
+            (_, x, _, i) = _split_digit(tree.prefix, i, item_measure)
+            break
+        i -= prefix_size
+        middle_size = _tree_size(tree.middle, _node_size)
+        if i < middle_size:
+            tree = tree.middle
+            depth += 1
+            continue
+        (_, x, _, i) = _split_digit(tree.suffix, i - middle_size, item_measure)
+        break
+    # Descend the nodes down to the item
+    for level in range(depth, 0, -1):
+        (_, x, _, i) = _split_digit(
+            x.items,
+            i,
+            measure if level == 1 else _node_size,
+        )
+    return (x, i)
+
+
+def _iter_tree(tree, reverse=False):
+    """Iterate over the values of a tree without recursion"""
+    # Stack of (tree or item, depth, is_tree). Depth tells how many levels of
+    # nodes an item has.
+    flip = (lambda xs: xs) if reverse else reversed
+    stack = [(tree, 0, True)]
+    while stack:
+        (x, depth, is_tree) = stack.pop()
+        if is_tree:
+            if isinstance(x, _Deep):
+                (first, last) = (
+                    (x.suffix, x.prefix) if reverse else
+                    (x.prefix, x.suffix)
+                )
+                stack.extend((y, depth, False) for y in flip(last))
+                stack.append((x.middle, depth + 1, True))
+                stack.extend((y, depth, False) for y in flip(first))
+            elif isinstance(x, _Single):
+                stack.append((x.item, depth, False))
+        elif depth == 0:
+            yield x
+        else:
+            stack.extend((y, depth - 1, False) for y in flip(x.items))
+
+
+#
+# Seq type
+#
+
+
+@immutable(init=False)
+class Seq(Monad, Monoid, Foldable, Eq):
+    """Persistent sequence with fast access at both ends and concatenation
+
+    See the module docstring for the time complexities.
+
+    """
+
+    __tree = attr.ib()
+
+    def __init__(self, *xs):
+        tree = _EMPTY
+        for x in xs:
+            tree = _snoc(tree, x, _value_size)
+        object.__setattr__(self, "_Seq__tree", tree)
+        return
+
+    def map(self, f):
+        """Seq a -> (a -> b) -> Seq b"""
+        return Seq.from_iter(map(f, self.to_iter()))
+
+    @class_function
+    def pure(cls, x):
+        """a -> Seq a"""
+        return _from_tree(_Single(x))
+
+    def apply(self, fs):
+        """Seq a -> Seq (a -> b) -> Seq b"""
+        return Seq.from_iter(
+            f(x) for (f, x) in itertools.product(fs.to_iter(), self.to_iter())
+        )
+
+    def bind(self, f):
+        """Seq a -> (a -> Seq b) -> Seq b"""
+        return Seq.from_iter(
+            itertools.chain.from_iterable(
+                f(x).to_iter() for x in self.to_iter()
+            )
+        )
+
+    def __eq__(self, other):
+        """Seq a -> Seq a -> bool"""
+        return (
+            self.length() == other.length() and
+            all(x == y for (x, y) in zip(self.to_iter(), other.to_iter()))
+        )
+
+    @class_property
+    def empty(cls):
+        """Empty sequence, type ``Seq a``"""
+        return _from_tree(_EMPTY)
+
+    def append(self, xs):
+        """Seq a -> Seq a -> Seq a
+
+        Takes logarithmic time with respect to the length of the shorter
+        sequence.
+
+        """
+        return _from_tree(_concat(self.__tree, (), xs.__tree, _value_size))
+
+    def cons(self, x):
+        """Seq a -> a -> Seq a
+
+        Add a value to the beginning in amortized constant time.
+
+        """
+        return _from_tree(_cons(x, self.__tree, _value_size))
+
+    def snoc(self, x):
+        """Seq a -> a -> Seq a
+
+        Add a value to the end in amortized constant time.
+
+        """
+        return _from_tree(_snoc(self.__tree, x, _value_size))
+
+    def head(self):
+        """Seq a -> a
+
+        Return the first value. Raises IndexError if the sequence is empty.
+
+        """
+        view = _view_left(self.__tree, _value_size)
+        if view is None:
+            raise IndexError("Empty sequence")
+        return view[0]
+
+    def tail(self):
+        """Seq a -> Seq a
+
+        Return the sequence without the first value. Raises IndexError if the
+        sequence is empty.
+
+        """
+        view = _view_left(self.__tree, _value_size)
+        if view is None:
+            raise IndexError("Empty sequence")
+        return _from_tree(view[1])
+
+    def last(self):
+        """Seq a -> a
+
+        Return the last value. Raises IndexError if the sequence is empty.
+
+        """
+        view = _view_right(self.__tree, _value_size)
+        if view is None:
+            raise IndexError("Empty sequence")
+        return view[1]
+
+    def init(self):
+        """Seq a -> Seq a
+
+        Return the sequence without the last value. Raises IndexError if the
+        sequence is empty.
+
+        """
+        view = _view_right(self.__tree, _value_size)
+        if view is None:
+            raise IndexError("Empty sequence")
+        return _from_tree(view[0])
+
+    def index(self, i):
+        """Seq a -> int -> a
+
+        Return the value at index ``i`` in logarithmic time. Negative indices
+        count from the end similarly as with Python sequences.
+
+        """
+        n = self.length()
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("Index out of range")
+        return _lookup(self.__tree, i, _value_size)[0]
+
+    def split_at(self, i):
+        """Seq a -> int -> (Seq a, Seq a)
+
+        Split the sequence into the first ``i`` values and the rest in
+        logarithmic time.
+
+        """
+        if i <= 0:
+            return (Seq.empty, self)
+        if i >= self.length():
+            return (self, Seq.empty)
+        (before, x, after, _) = _split_tree(self.__tree, i, _value_size)
+        return (_from_tree(before), _from_tree(_cons(x, after, _value_size)))
+
+    def __getitem__(self, i):
+        return self.index(i)
+
+    def to_iter(self):
+        return _iter_tree(self.__tree)
+
+    @class_function
+    def from_iter(cls, xs):
+        """Iterable f => f a -> Seq a"""
+        tree = _EMPTY
+        for x in xs:
+            tree = _snoc(tree, x, _value_size)
+        return _from_tree(tree)
+
+    def length(self):
+        return _tree_size(self.__tree, _value_size)
+
+    def foldl(self, combine, initial):
+        """Seq a -> (b -> a -> b) -> b -> b"""
+        return functools.reduce(combine, self.to_iter(), initial)
+
+    def foldr(self, combine, initial):
+        """Seq a -> (a -> b -> b) -> b -> b"""
+        acc = initial
+        for x in _iter_tree(self.__tree, reverse=True):
+            acc = combine(x, acc)
+        return acc
+
+    def __repr__(self):
+        return "Seq({})".format(", ".join(repr(x) for x in self.to_iter()))
+
+    #
+    # Sampling methods for property tests
+    #
+
+    @class_function
+    def sample_value(cls, a):
+        # Concatenate a few sequences so that the trees have various shapes
+        return st.lists(
+            st.lists(a, max_size=10).map(cls.from_iter),
+            max_size=3,
+        ).map(lambda xss: functools.reduce(Seq.append, xss, Seq.empty))
+
+    @class_function
+    def sample_monoid_type(cls):
+        t = testing.sample_type()
+        return t.map(cls.sample_value)
+
+    @class_function
+    def sample_eq_type(cls):
+        t = testing.sample_eq_type()
+        return t.map(cls.sample_value)
+
+    def __eq_test__(self, other, data=None):
+        return (
+            False if self.length() != other.length() else
+            all(
+                eq_test(x, y, data)
+                for (x, y) in zip(self.to_iter(), other.to_iter())
+            )
+        )
+
+
+def _from_tree(tree):
+    """Create Seq that uses the given finger tree as its storage"""
+    xs = object.__new__(Seq)
+    object.__setattr__(xs, "_Seq__tree", tree)
+    return xs
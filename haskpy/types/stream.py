@@ -0,0 +1,370 @@
+"""Lazy stream for infinite and huge sequences
+
+Stream is a lazily evaluated linked list. Its cells are computed only when
+they are needed, and once computed, they are memoized so that streams sharing
+a prefix compute it only once. ``map``, ``apply``, ``bind``, ``append``,
+``take`` and ``drop`` are all deferred, so pipelines over unbounded data, for
+instance,
+
+.. code-block:: python
+
+    Stream.iterate(lambda x: x + 1, 0).map(lambda x: x ** 2).take(1000000)
+
+don't compute anything until iterated. Iterating a stream that isn't referenced
+elsewhere runs in constant memory, because the already iterated cells can be
+garbage collected.
+
+"""
+
+import attr
+import functools
+
+from haskpy.typeclasses import Monad, Monoid, Foldable, Eq
+from haskpy.types.trampoline import Done, Suspend
+from haskpy import testing
+from haskpy.utils import (
+    st,
+    immutable,
+    class_property,
+    class_function,
+    eq_test,
+)
+
+
+class _Lazy():
+    """Memoized cell of a stream
+
+    Until forced, ``thunk`` is a function that returns one of the following:
+
+    - None for an empty stream
+
+    - a pair of the first value and the rest of the stream
+
+    - another stream that gives the cell (a tail call, which is evaluated in
+      the loop in ``_force`` instead of recursively)
+
+    Once forced, ``thunk`` is None and ``value`` contains the cell (None or a
+    pair). For concatenations, ``parts`` contains the concatenated streams
+    until forced, so that nested concatenations can be flattened.
+
+    """
+
+    __slots__ = ("thunk", "value", "parts")
+
+    def __init__(self, thunk, value=None, parts=None):
+        self.thunk = thunk
+        self.value = value
+        self.parts = parts
+
+
+def _force(stream):
+    """Return the memoized cell of a stream: None or (value, rest)"""
+    lazy = stream._Stream__lazy
+    forced = []
+    while lazy.thunk is not None:
+        forced.append(lazy)
+        result = lazy.thunk()
+        if isinstance(result, Stream):
+            lazy = result._Stream__lazy
+        else:
+            break
+    else:
+        result = lazy.value
+    # Memoize the result for the whole chain of tail calls and release the
+    # thunks so their closures can be garbage collected
+    for lazy in forced:
+        lazy.value = result
+        lazy.thunk = None
+        lazy.parts = None
+    return result
+
+
+def _lazy_stream(thunk):
+    return _from_lazy(_Lazy(thunk))
+
+
+def _from_cell(cell):
+    return _from_lazy(_Lazy(None, cell))
+
+
+def _from_lazy(lazy):
+    stream = object.__new__(Stream)
+    object.__setattr__(stream, "_Stream__lazy", lazy)
+    return stream
+
+
+def _concat(parts):
+    """Lazily concatenate streams
+
+    ``parts`` is a linked list ``(item, rest)`` of streams. An item can be also
+    a nested linked list of streams. The linked lists allow flattening nested
+    concatenations (e.g., a long chain of appends) in constant time per step
+    without recursion.
+
+    """
+
+    def thunk():
+        rest = parts
+        while rest is not None:
+            (item, rest) = rest
+            if isinstance(item, tuple):
+                # Nested list of parts
+                (first, others) = item
+                rest = (first, rest if others is None else (others, rest))
+                continue
+            nested = item._Stream__lazy.parts
+            if nested is not None:
+                # Not yet forced concatenation
+                rest = (nested, rest)
+                continue
+            if rest is None:
+                # Tail call
+                return item
+            cell = _force(item)
+            if cell is not None:
+                (x, xs) = cell
+                return (x, _concat((xs, rest)))
+        return None
+
+    return _from_lazy(_Lazy(thunk, parts=parts))
+
+
+def _iter_stream(stream):
+    # NOTE: Don't keep a reference to the head of the stream so that iterated
+    # cells can be garbage collected.
+    while True:
+        cell = _force(stream)
+        if cell is None:
+            return
+        (x, stream) = cell
+        yield x
+
+
+@immutable(init=False)
+class Stream(Monad, Monoid, Foldable, Eq):
+    """Lazy, memoized and possibly infinite sequence"""
+
+    __lazy = attr.ib()
+
+    def __init__(self, *xs):
+        stream = _from_cell(None)
+        for x in reversed(xs):
+            stream = _from_cell((x, stream))
+        object.__setattr__(self, "_Stream__lazy", stream.__lazy)
+        return
+
+    @class_function
+    def from_iter(cls, xs):
+        """Iterable f => f a -> Stream a
+
+        The iterable is consumed lazily and only once.
+
+        """
+        it = iter(xs)
+
+        def next_stream():
+            return _lazy_stream(step)
+
+        def step():
+            for x in it:
+                return (x, next_stream())
+            return None
+
+        return next_stream()
+
+    @class_function
+    def iterate(cls, f, x):
+        """(a -> a) -> a -> Stream a
+
+        Infinite stream ``x, f(x), f(f(x)), ...``.
+
+        """
+        return _lazy_stream(lambda: (x, Stream.iterate(f, f(x))))
+
+    def cons(self, x):
+        """Stream a -> a -> Stream a
+
+        Add a value to the beginning.
+
+        """
+        return _from_cell((x, self))
+
+    def take(self, n):
+        """Stream a -> int -> Stream a
+
+        Lazily take the first ``n`` values.
+
+        """
+        def thunk():
+            if n <= 0:
+                return None
+            cell = _force(self)
+            if cell is None:
+                return None
+            (x, xs) = cell
+            return (x, xs.take(n - 1))
+        return _lazy_stream(thunk)
+
+    def drop(self, n):
+        """Stream a -> int -> Stream a
+
+        Lazily drop the first ``n`` values.
+
+        """
+        def thunk():
+            stream = self
+            for _ in range(n):
+                cell = _force(stream)
+                if cell is None:
+                    return None
+                stream = cell[1]
+            return stream
+        return _lazy_stream(thunk)
+
+    def map(self, f):
+        """Stream a -> (a -> b) -> Stream b"""
+        def thunk():
+            cell = _force(self)
+            if cell is None:
+                return None
+            (x, xs) = cell
+            return (f(x), xs.map(f))
+        return _lazy_stream(thunk)
+
+    @class_function
+    def pure(cls, x):
+        """a -> Stream a"""
+        return _from_cell((x, Stream.empty))
+
+    def apply(self, fs):
+        """Stream a -> Stream (a -> b) -> Stream b"""
+        return fs.bind(lambda f: self.map(f))
+
+    def bind(self, f):
+        """Stream a -> (a -> Stream b) -> Stream b"""
+        def thunk():
+            cell = _force(self)
+            if cell is None:
+                return None
+            (x, xs) = cell
+            return f(x).append(xs.bind(f))
+        return _lazy_stream(thunk)
+
+    @class_property
+    def empty(cls):
+        """Empty stream, type ``Stream a``"""
+        return _from_cell(None)
+
+    def append(self, xs):
+        """Stream a -> Stream a -> Stream a"""
+        return _concat((self, (xs, None)))
+
+    def __eq__(self, other):
+        """Stream a -> Stream a -> bool"""
+        (xs, ys) = (self, other)
+        while True:
+            (xcell, ycell) = (_force(xs), _force(ys))
+            if xcell is None or ycell is None:
+                # Equal only if both ended
+                return xcell is ycell
+            ((x, xs), (y, ys)) = (xcell, ycell)
+            if not (x == y):
+                return False
+
+    def to_iter(self):
+        return _iter_stream(self)
+
+    def __iter__(self):
+        # The default implementation is a generator which would keep a
+        # reference to the head of the stream
+        return _iter_stream(self)
+
+    def null(self):
+        return _force(self) is None
+
+    def length(self):
+        return sum(1 for _ in self.to_iter())
+
+    def foldl(self, combine, initial):
+        """Stream a -> (b -> a -> b) -> b -> b"""
+        return functools.reduce(combine, self.to_iter(), initial)
+
+    def foldr(self, combine, initial):
+        """Stream a -> (a -> b -> b) -> b -> b
+
+        The stream must be finite because ``combine`` is strict. See
+        ``foldr_lazy`` for short-circuiting folds.
+
+        """
+        return self.foldr_lazy(
+            lambda x, rest: rest.map(lambda acc: combine(x, acc)),
+            initial,
+        )
+
+    def foldr_lazy(self, combine, initial):
+        """Stream a -> (a -> Trampoline b -> Trampoline b) -> b -> b
+
+        Right fold where ``combine`` gets the fold of the rest of the stream as
+        a suspended ``Trampoline``. If ``combine`` doesn't use it, the fold
+        stops, so this works also for infinite streams. For instance:
+
+        .. code-block:: python
+
+            Stream.iterate(lambda x: x + 1, 0).foldr_lazy(
+                lambda x, rest: Done(x) if x > 10 else rest,
+                None,
+            )
+
+        The fold is evaluated in a loop by ``Trampoline.run``, so it doesn't
+        hit the recursion limit.
+
+        """
+        def fold(stream):
+            cell = _force(stream)
+            if cell is None:
+                return Done(initial)
+            (x, xs) = cell
+            return combine(x, Suspend(lambda: fold(xs)))
+        return fold(self).run()
+
+    def __repr__(self):
+        # Show only the values that have been computed already
+        values = []
+        lazy = self.__lazy
+        while lazy.thunk is None and lazy.value is not None:
+            (x, xs) = lazy.value
+            values.append(repr(x))
+            lazy = xs.__lazy
+        if lazy.thunk is not None:
+            values.append("...")
+        return "Stream({})".format(", ".join(values))
+
+    #
+    # Sampling methods for property tests
+    #
+
+    @class_function
+    def sample_value(cls, a):
+        # Concatenate a few streams so that also deferred streams are sampled
+        return st.lists(
+            st.lists(a, max_size=5).map(cls.from_iter),
+            max_size=3,
+        ).map(lambda xss: functools.reduce(Stream.append, xss, Stream.empty))
+
+    @class_function
+    def sample_monoid_type(cls):
+        t = testing.sample_type()
+        return t.map(cls.sample_value)
+
+    @class_function
+    def sample_eq_type(cls):
+        t = testing.sample_eq_type()
+        return t.map(cls.sample_value)
+
+    def __eq_test__(self, other, data=None):
+        xs = tuple(self.to_iter())
+        ys = tuple(other.to_iter())
+        return (
+            False if len(xs) != len(ys) else
+            all(eq_test(x, y, data) for (x, y) in zip(xs, ys))
+        )
@@ -0,0 +1,105 @@
+import pytest
+
+from haskpy.types.linkedlist import LinkedList
+from haskpy.types.list import List
+from haskpy.types.maybe import Just, Nothing
+from haskpy.conftest import make_test_class
+
+
+# Test typeclass laws for LinkedList
+TestLinkedList = make_test_class(LinkedList)
+
+
+def test_linkedlist_sharing():
+    xs = LinkedList(2, 3)
+    ys = xs.cons(1)
+    zs = xs.cons(0)
+    assert list(ys) == [1, 2, 3]
+    assert list(zs) == [0, 2, 3]
+    assert list(xs) == [2, 3]
+    # Tails are shared, not copied
+    assert ys.tail()._LinkedList__cell is xs._LinkedList__cell
+    assert ys.head() == 1
+    assert ys.length() == 3
+    assert ys.tail().tail().tail().null()
+    assert LinkedList(1).append(xs).tail()._LinkedList__cell is \
+        xs._LinkedList__cell
+    assert repr(ys) == "LinkedList(1, 2, 3)"
+    assert repr(LinkedList.empty) == "LinkedList()"
+    return
+
+
+def test_linkedlist_eq():
+    # Elements are compared with == only, because HaskPy types don't have !=
+    assert LinkedList(Just(1), Nothing) == LinkedList(Just(1), Nothing)
+    assert not LinkedList(Just(1), Nothing) == LinkedList(Just(2), Nothing)
+    assert not LinkedList(Just(1)) == LinkedList(Just(1), Nothing)
+    xs = LinkedList(Just(2))
+    assert xs.cons(Just(1)) == xs.cons(Just(1))
+    assert not xs.cons(Nothing) == xs.cons(Just(1))
+    return
+
+
+def test_linkedlist_errors():
+    with pytest.raises(IndexError):
+        LinkedList.empty.head()
+    with pytest.raises(IndexError):
+        LinkedList.empty.tail()
+    return
+
+
+def test_linkedlist_large():
+    # Traversals don't hit the recursion limit
+    n = 1000000
+    xs = LinkedList.empty
+    for i in range(n):
+        xs = xs.cons(i)
+    assert xs.length() == n
+    assert xs.foldl(lambda acc, x: acc + 1, 0) == n
+    assert xs.foldr(lambda x, acc: acc + 1, 0) == n
+    assert xs == LinkedList.from_iter(range(n - 1, -1, -1))
+    assert not xs == xs.tail().cons(-1)
+    assert len(repr(xs)) > n
+    assert sum(xs) == n * (n - 1) // 2
+    return
+
+
+def test_linkedlist_monad():
+    assert LinkedList(1, 2).map(lambda x: 10 * x) == LinkedList(10, 20)
+    assert LinkedList(1, 2).apply(
+        LinkedList(lambda x: x + 10, lambda x: x + 100)
+    ) == LinkedList(11, 12, 101, 102)
+    assert LinkedList(1, 2).bind(lambda x: LinkedList(x, 10 * x)) == \
+        LinkedList(1, 10, 2, 20)
+    return
+
+
+def benchmark_linkedlist_cons():
+
+    import timeit
+
+    def run(name, g, number=1):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    def prepends(M, n):
+        xs = M.empty
+        for i in range(n):
+            xs = M.pure(i).append(xs)
+        return xs
+
+    def conses(n):
+        xs = LinkedList.empty
+        for i in range(n):
+            xs = xs.cons(i)
+        return xs
+
+    for n in [1000, 10000, 100000]:
+        print("{0} prepends".format(n))
+        if n <= 10000:
+            run("  List.pure(x).append(xs)", lambda: prepends(List, n))
+        run("  LinkedList.pure(x).append(xs)", lambda: prepends(LinkedList, n))
+        run("  LinkedList.cons", lambda: conses(n))
+
+    return
@@ -1,3 +1,5 @@
+import pytest
+
 from haskpy.types.list import List
 from haskpy.conftest import make_test_class
 
@@ -49,3 +51,253 @@ def test_list_foldl():
         "x"
     )
     return
+
+
+def benchmark_list_folds():
+
+    import functools
+    import timeit
+    from haskpy.utils import curry
+
+    def run(name, g, number=3):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    def add(a, b):
+        return a + b
+
+    for n in [1000, 1000000]:
+        values = tuple(range(n))
+        xs = List(*values)
+        print("{0} elements".format(n))
+        run("  functools.reduce", lambda: functools.reduce(add, values, 0))
+        run("  List.foldl", lambda: xs.foldl(add, 0))
+        run("  List.foldr", lambda: xs.foldr(add, 0))
+        if n <= 1000:
+            # List.foldl before calling combine directly
+            run(
+                "  reduce with curry per element",
+                lambda: functools.reduce(
+                    lambda a, b: curry(add)(a)(b),
+                    values,
+                    0,
+                ),
+            )
+
+    return
+
+
+def test_list_from_iter():
+    assert List.from_iter(range(3)) == List(0, 1, 2)
+    assert List.from_iter(x for x in "abc") == List("a", "b", "c")
+    assert List.from_iter([]) == List()
+    assert List.from_iter((1, 2, 3)) == List(1, 2, 3)
+
+    # Class functions keep the type of subclasses
+    class MyList(List):
+        pass
+
+    assert type(MyList.from_iter([1, 2])) is MyList
+    assert type(MyList.pure(1)) is MyList
+    assert type(MyList.empty) is MyList
+    assert MyList.from_iter([1, 2]) == List(1, 2)
+    return
+
+
+def benchmark_list_construction():
+
+    import gc
+    import timeit
+    import tracemalloc
+
+    def from_iter_splat(xs):
+        # List.from_iter before the zero-copy constructor
+        return List(*xs)
+
+    def run(name, g):
+        gc.collect()
+        tracemalloc.start()
+        g()
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        t = timeit.timeit(g, number=3) / 3
+        print("{0:<32}{1:10.2f} ms{2:10.1f} MB".format(name, 1e3 * t, peak / 1e6))
+        return
+
+    n = 1000000
+    values = list(range(n))
+    xs = List.from_iter(values)
+    print("{0} elements: time, peak memory".format(n))
+    run("  List(*xs)", lambda: from_iter_splat(values))
+    run("  List.from_iter(list)", lambda: List.from_iter(values))
+    run("  List.from_iter(generator)", lambda: List.from_iter(x for x in values))
+    run("  List(*map(f, xs))", lambda: List(*(abs(x) for x in values)))
+    run("  xs.map(f)", lambda: xs.map(abs))
+    run("  List(*xs, *xs)", lambda: List(*values, *values))
+    run("  xs.append(xs)", lambda: xs.append(xs))
+
+    return
+
+
+def test_list_bind():
+    assert List(1, 2, 3).bind(lambda x: List(x) if x > 1 else List()) == \
+        List(2, 3)
+    assert List(1, 2).bind(lambda x: List(x, 10 * x)) == List(1, 10, 2, 20)
+    return
+
+
+def test_list_product():
+    from haskpy.functions import liftA2
+    xs = List(1, 2)
+    ys = List("a", "b", "c")
+    pair = lambda x: lambda y: (x, y)
+    assert xs.product(ys) == liftA2(pair, xs, ys)
+    assert xs.product(ys) == List(
+        (1, "a"), (1, "b"), (1, "c"), (2, "a"), (2, "b"), (2, "c"),
+    )
+    assert xs.product(List()) == List()
+    return
+
+
+def benchmark_list_apply():
+
+    import timeit
+    from haskpy.functions import liftA2
+
+    def apply_before(xs, fs):
+        # List.apply before the single-pass implementation
+        return List(*(y for f in fs for y in xs.map(f)))
+
+    def bind_before(xs, f):
+        # List.bind before the single-pass implementation
+        return List(*(y for ys in xs.map(f) for y in ys))
+
+    def run(name, g, number=3):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    n = 1000
+    xs = List.from_iter(range(n))
+    fs = List.from_iter((lambda k: lambda x: x + k)(k) for k in range(n))
+    pair = lambda x: lambda y: (x, y)
+    f = lambda x: List(x, x)
+    print("{0} x {0} elements".format(n))
+    run("  apply (before)", lambda: apply_before(xs, fs))
+    run("  apply", lambda: xs.apply(fs))
+    run("  liftA2 pair", lambda: liftA2(pair, xs, xs))
+    run("  product", lambda: xs.product(xs))
+    print("{0} elements".format(n * n))
+    ys = List.from_iter(range(n * n))
+    run("  bind (before)", lambda: bind_before(ys, f))
+    run("  bind", lambda: ys.bind(f))
+
+    return
+
+
+def _collatz_steps(x):
+    """CPU-heavy function for the parallel fold_map tests and benchmarks"""
+    from haskpy.types.monoids import Sum
+    n = 0
+    x = x + 1
+    while x != 1:
+        x = x // 2 if x % 2 == 0 else 3 * x + 1
+        n += 1
+    return Sum(n)
+
+
+def test_list_fold_map_parallel():
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from haskpy.types.monoids import Sum, String
+
+    xs = List.from_iter(range(1000))
+    expected = xs.fold_map(String, lambda x: String(str(x)))
+    assert expected == String("".join(str(x) for x in range(1000)))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Non-commutative monoids are combined in order
+        for chunksize in [None, 1, 7, 1000, 5000]:
+            assert xs.fold_map(
+                String,
+                lambda x: String(str(x)),
+                executor=executor,
+                chunksize=chunksize,
+            ) == expected
+        # Commutative monoids in any order
+        assert xs.fold_map(Sum, Sum, executor=executor, chunksize=10) == \
+            Sum(499500)
+        assert List().fold_map(Sum, Sum, executor=executor) == Sum(0)
+        # Non-positive chunk sizes are errors instead of wrong results
+        for chunksize in [0, -1]:
+            with pytest.raises(ValueError):
+                List(1, 2, 3).fold_map(
+                    Sum,
+                    Sum,
+                    executor=executor,
+                    chunksize=chunksize,
+                )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert xs.fold_map(Sum, _collatz_steps, executor=executor) == \
+            xs.fold_map(Sum, _collatz_steps)
+    return
+
+
+def benchmark_list_fold_map_parallel():
+
+    import os
+    import timeit
+    from concurrent.futures import ProcessPoolExecutor
+    from haskpy.types.monoids import Sum
+
+    def run(name, g, number=1):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    xs = List.from_iter(range(200000))
+    print("fold_map of 200000 values with CPU-heavy f")
+    run("  sequential", lambda: xs.fold_map(Sum, _collatz_steps))
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            run(
+                "  {0} processes".format(workers),
+                lambda: xs.fold_map(Sum, _collatz_steps, executor=executor),
+            )
+        workers *= 2
+
+    return
+
+
+def benchmark_fold_map_balanced():
+
+    import functools
+    import timeit
+    from haskpy.types.monoids import String
+
+    def fold_map_left(monoid, f, xs):
+        # Foldable.fold_map before the balanced reduction
+        return functools.reduce(
+            lambda m, x: m.append(f(x)),
+            xs.to_iter(),
+            monoid.empty,
+        )
+
+    def run(name, g, number=1):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    n = 100000
+    xs = List.from_iter(range(n))
+    print("fold_map over {0} values".format(n))
+    for (name, monoid, f) in [
+            ("String", String, lambda x: String(str(x))),
+            ("List", List, List.pure),
+    ]:
+        run("  left fold " + name, lambda: fold_map_left(monoid, f, xs))
+        run("  balanced " + name, lambda: xs.fold_map(monoid, f))
+
+    return
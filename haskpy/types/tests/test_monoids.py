@@ -60,3 +60,217 @@ def test_function_type_in_endo(data):
     )
 
     return
+
+
+def test_endo_flat():
+
+    inc = Endo(lambda x: x + 1)
+    double = Endo(lambda x: 2 * x)
+
+    # Long compositions don't hit the recursion limit
+    e = Endo.empty
+    for _ in range(100000):
+        e = e.append(inc)
+    assert e.app_endo(0) == 100000
+
+    # Appending to an Endo that has already been appended to
+    a = double.append(inc)
+    b = double.append(double)
+    assert double.app_endo(1) == 2
+    assert a.app_endo(1) == 4
+    assert b.app_endo(1) == 4
+    assert a.append(b).app_endo(1) == 10
+    assert b.append(a).app_endo(1) == 16
+    assert a.append(a).app_endo(1) == 10
+
+    # Appending to a shared Endo in several threads
+    from concurrent.futures import ThreadPoolExecutor
+    base = Endo.empty.append(inc)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda i: base.append(Endo(lambda x: x + i)).append(double),
+            range(1000),
+        ))
+    assert all(e.app_endo(0) == i + 1 for (i, e) in enumerate(results))
+    return
+
+
+def test_default_folds_with_endo():
+
+    import pytest
+    from haskpy.typeclasses import Foldable
+    from haskpy.utils import PerformanceWarning
+
+    class Range(Foldable):
+        """Foldable with only fold_map implemented"""
+
+        def __init__(self, n):
+            self.n = n
+
+        def fold_map(self, monoid, f):
+            m = monoid.empty
+            for x in range(self.n):
+                m = m.append(f(x))
+            return m
+
+    # Default foldr and foldl don't hit the recursion limit
+    xs = Range(10000)
+    with pytest.warns(PerformanceWarning):
+        assert xs.foldr(lambda a, b: a - b, 0) == -5000
+    with pytest.warns(PerformanceWarning):
+        assert xs.foldl(lambda b, a: b - a, 0) == -49995000
+    with pytest.warns(PerformanceWarning):
+        assert Range(3).foldl(lambda b, a: "({}+{})".format(b, a), "x") == (
+            "(((x+0)+1)+2)"
+        )
+
+    # Default to_iter takes linear time and doesn't nest iterators, so the
+    # methods based on it work for large foldables too
+    n = 100000
+    xs = Range(n)
+    with pytest.warns(PerformanceWarning):
+        assert list(xs.to_iter()) == list(range(n))
+    with pytest.warns(PerformanceWarning):
+        assert len(xs) == n
+    with pytest.warns(PerformanceWarning):
+        assert xs.sum() == n * (n - 1) // 2
+    with pytest.warns(PerformanceWarning):
+        assert n - 1 in xs
+    with pytest.warns(PerformanceWarning):
+        assert not xs.null()
+    return
+
+
+def benchmark_default_to_iter():
+
+    import timeit
+    import warnings
+    from haskpy.typeclasses import Foldable
+    from haskpy.types.list import List
+    from haskpy.utils import PerformanceWarning
+
+    class FoldlOnly(Foldable):
+        """Foldable with only foldl implemented"""
+
+        def __init__(self, xs):
+            self.xs = xs
+
+        def foldl(self, combine, initial):
+            return List.foldl(self.xs, combine, initial)
+
+    def run(name, g, number=3):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    warnings.simplefilter("ignore", PerformanceWarning)
+    for n in [1000, 100000, 1000000]:
+        xs = List.from_iter(range(n))
+        ys = FoldlOnly(xs)
+        print("{0} values".format(n))
+        run("  custom to_iter: sum", lambda: xs.sum())
+        run("  default to_iter: sum", lambda: ys.sum())
+
+    return
+
+
+def benchmark_endo():
+
+    import attr
+    import timeit
+    from haskpy.typeclasses import Monoid
+    from haskpy.utils import immutable
+
+    @immutable
+    class NestedEndo(Monoid):
+        # Endo before the flat representation
+
+        app_endo = attr.ib()
+
+        def append(self, f):
+            return NestedEndo(lambda a: self.app_endo(f.app_endo(a)))
+
+    def run(name, g, number=10):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    inc = lambda x: x + 1
+
+    def build(E, n):
+        e = E(lambda x: x)
+        for _ in range(n):
+            e = e.append(E(inc))
+        return e
+
+    for n in [100, 900, 100000]:
+        print("{0} functions".format(n))
+        if n < 1000:
+            f = build(NestedEndo, n)
+            run("  nested: build", lambda: build(NestedEndo, n))
+            run("  nested: apply", lambda: f.app_endo(0))
+        e = build(Endo, n)
+        run("  flat: build", lambda: build(Endo, n))
+        run("  flat: apply", lambda: e.app_endo(0))
+
+    return
+
+
+def test_mconcat():
+    from haskpy.types.list import List
+    assert Sum.mconcat(Sum(x) for x in range(5)) == Sum(10)
+    assert Sum.mconcat([]) == Sum(0)
+    assert And.mconcat([And(True), And(False)]) == And(False)
+    assert Or.mconcat([Or(False), Or(True)]) == Or(True)
+    assert String.mconcat([String("a"), String("b")]) == String("ab")
+    assert List.mconcat([List(1), List(), List(2, 3)]) == List(1, 2, 3)
+
+    # And and Or stop at the first value that decides the result
+    def booleans(values):
+        for x in values:
+            if x is None:
+                raise RuntimeError("Shouldn't be evaluated")
+            yield x
+
+    assert And.mconcat(And(x) for x in booleans([True, False, None])) == \
+        And(False)
+    assert Or.mconcat(Or(x) for x in booleans([False, True, None])) == \
+        Or(True)
+    return
+
+
+def benchmark_mconcat():
+
+    import functools
+    import timeit
+    from haskpy.types.list import List
+
+    def fold_map_append(monoid, f, xs):
+        # fold_map before mconcat
+        return functools.reduce(
+            lambda m, x: m.append(f(x)),
+            xs.to_iter(),
+            monoid.empty,
+        )
+
+    def run(name, g, number=3):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    n = 1000000
+    xs = List.from_iter(range(n))
+    ms = [Sum(x) for x in range(n)]
+    print("{0} values".format(n))
+    for (name, monoid, f) in [
+            ("Sum", Sum, Sum),
+            ("And", And, lambda x: And(x >= 0)),
+            ("Or", Or, lambda x: Or(x < 0)),
+            ("String", String, lambda x: String("a")),
+    ]:
+        run("  append " + name, lambda: fold_map_append(monoid, f, xs))
+        run("  fold_map " + name, lambda: xs.fold_map(monoid, f))
+    run("  append Sum values", lambda: functools.reduce(Sum.append, ms))
+    run("  Sum.mconcat", lambda: Sum.mconcat(ms))
+
+    return
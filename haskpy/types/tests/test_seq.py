@@ -0,0 +1,126 @@
+import pytest
+
+from haskpy.types.seq import Seq
+from haskpy.types.list import List
+from haskpy.conftest import make_test_class
+
+
+# Test typeclass laws for Seq
+TestSeq = make_test_class(Seq)
+
+
+def test_seq_against_list():
+    """Compare a sequence of random operations against Python lists"""
+    import random
+    rng = random.Random(42)
+
+    xs = Seq.empty
+    ys = []
+    for _ in range(2000):
+        r = rng.random()
+        if r < 0.25:
+            x = rng.random()
+            (xs, ys) = (xs.cons(x), [x] + ys)
+        elif r < 0.5:
+            x = rng.random()
+            (xs, ys) = (xs.snoc(x), ys + [x])
+        elif r < 0.6:
+            zs = list(range(rng.randint(0, 30)))
+            (xs, ys) = (xs.append(Seq.from_iter(zs)), ys + zs)
+        elif r < 0.7:
+            zs = list(range(rng.randint(0, 30)))
+            (xs, ys) = (Seq.from_iter(zs).append(xs), zs + ys)
+        elif r < 0.8:
+            i = rng.randint(-1, len(ys) + 1)
+            (left, right) = xs.split_at(i)
+            assert list(left) == ys[:max(i, 0)]
+            assert list(right) == ys[max(i, 0):]
+            (xs, ys) = (right.append(left), ys[max(i, 0):] + ys[:max(i, 0)])
+        elif r < 0.9 and len(ys) > 0:
+            (xs, ys) = (xs.tail(), ys[1:])
+        elif len(ys) > 0:
+            (xs, ys) = (xs.init(), ys[:-1])
+
+        assert xs.length() == len(ys)
+        assert list(xs) == ys
+        if len(ys) > 0:
+            assert xs.head() == ys[0]
+            assert xs.last() == ys[-1]
+            i = rng.randrange(len(ys))
+            assert xs[i] == ys[i]
+            assert xs[-1] == ys[-1]
+
+    assert xs.foldr(lambda x, acc: [x] + acc, []) == ys
+    assert xs.foldl(lambda acc, x: acc + [x], []) == ys
+    return
+
+
+def test_seq_large():
+    n = 100000
+    xs = Seq.from_iter(range(n))
+    assert xs[54321] == 54321
+    (left, right) = xs.split_at(54321)
+    assert left.length() == 54321
+    assert left.last() == 54320
+    assert right.head() == 54321
+    assert xs.append(xs)[n + 5] == 5
+    assert xs.foldr(lambda x, acc: acc + 1, 0) == n
+    return
+
+
+def test_seq_errors():
+    with pytest.raises(IndexError):
+        Seq.empty.head()
+    with pytest.raises(IndexError):
+        Seq.empty.tail()
+    with pytest.raises(IndexError):
+        Seq.empty.last()
+    with pytest.raises(IndexError):
+        Seq.empty.init()
+    with pytest.raises(IndexError):
+        Seq(1, 2)[2]
+    with pytest.raises(IndexError):
+        Seq(1, 2)[-3]
+    return
+
+
+def test_seq_monad():
+    assert Seq(1, 2).map(lambda x: 10 * x) == Seq(10, 20)
+    assert Seq(1, 2).apply(Seq(lambda x: x + 10, lambda x: x + 100)) == \
+        Seq(11, 12, 101, 102)
+    assert Seq(1, 2).bind(lambda x: Seq(x, 10 * x)) == Seq(1, 10, 2, 20)
+    return
+
+
+def benchmark_seq_append():
+
+    import timeit
+    from haskpy.functions import fold_map
+
+    def run(name, g, number=1):
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms".format(name, 1e3 * t))
+        return
+
+    def appends(M, n):
+        xs = M.empty
+        for i in range(n):
+            xs = xs.append(M.pure(i))
+        return xs
+
+    for n in [1000, 10000, 100000]:
+        values = List.from_iter(range(n))
+        print("{0} appends".format(n))
+        if n <= 10000:
+            run("  List.append", lambda: appends(List, n))
+            run("  fold_map(List, ...)", lambda: fold_map(List, List.pure, values))
+        run("  Seq.append", lambda: appends(Seq, n))
+        run("  fold_map(Seq, ...)", lambda: fold_map(Seq, Seq.pure, values))
+
+    xs = Seq.from_iter(range(100000))
+    print("100000 elements")
+    run("  Seq index", lambda: xs[54321], number=10000)
+    run("  Seq split_at", lambda: xs.split_at(54321), number=10000)
+    run("  Seq cons", lambda: xs.cons(0), number=10000)
+
+    return
@@ -0,0 +1,151 @@
+from haskpy.types.stream import Stream
+from haskpy.types.list import List
+from haskpy.types.trampoline import Done
+from haskpy.types.maybe import Just, Nothing
+from haskpy.conftest import make_test_class
+
+
+# Test typeclass laws for Stream
+TestStream = make_test_class(Stream)
+
+
+def naturals():
+    return Stream.iterate(lambda x: x + 1, 0)
+
+
+def test_stream_infinite():
+    assert list(naturals().take(5)) == [0, 1, 2, 3, 4]
+    assert list(naturals().drop(3).take(3)) == [3, 4, 5]
+    assert list(naturals().map(lambda x: 2 * x).take(3)) == [0, 2, 4]
+    assert list(
+        naturals().bind(lambda x: Stream(x, -x) if x % 2 else Stream.empty)
+        .take(4)
+    ) == [1, -1, 3, -3]
+    assert list(naturals().take(3).append(naturals()).take(5)) == \
+        [0, 1, 2, 0, 1]
+    assert 1000 in naturals()
+    assert not naturals().null()
+    assert Stream.empty.null()
+    return
+
+
+def test_stream_memoized():
+    calls = []
+    xs = naturals().map(lambda x: calls.append(x) or x)
+    assert list(xs.take(3)) == [0, 1, 2]
+    assert list(xs.take(5)) == [0, 1, 2, 3, 4]
+    # Shared prefix is computed only once
+    assert calls == [0, 1, 2, 3, 4]
+    assert repr(xs.take(0)) == "Stream(...)"
+    assert repr(Stream(1, 2)) == "Stream(1, 2)"
+    return
+
+
+def test_stream_eq():
+    # Streams of different lengths aren't equal and elements are compared
+    # only with ==
+    assert Stream(Just(1), Nothing) == Stream(Just(1), Nothing)
+    assert not Stream(Just(1)) == Stream(Just(1), Just(2))
+    assert not Stream(Just(1), Just(2)) == Stream(Just(1))
+    assert not Stream(Nothing) == Stream(Just(1))
+    assert not Stream.empty == Stream(Just(1))
+    # Stops at the first difference, so also infinite streams can differ
+    assert not naturals().map(Just) == naturals().map(Just).drop(1)
+    assert not naturals() == naturals().take(3)
+    return
+
+
+def test_stream_from_iter():
+    it = iter(range(5))
+    xs = Stream.from_iter(it)
+    assert list(xs) == [0, 1, 2, 3, 4]
+    # The iterator is consumed only once
+    assert list(xs) == [0, 1, 2, 3, 4]
+    return
+
+
+def test_stream_deep():
+    # Long chains of appends and binds don't hit the recursion limit
+    n = 100000
+    xs = Stream.empty
+    ys = Stream.empty
+    for i in range(n):
+        xs = xs.append(Stream.pure(i))
+        ys = Stream.pure(i).append(ys)
+    assert xs.length() == n
+    assert ys.length() == n
+    assert list(xs.take(3)) == [0, 1, 2]
+    assert list(ys.take(3)) == [n - 1, n - 2, n - 3]
+    zs = naturals().bind(lambda x: Stream.empty if x < n else Stream.pure(x))
+    assert next(iter(zs)) == n
+    assert list(naturals().drop(n).take(1)) == [n]
+    return
+
+
+def test_stream_foldr_lazy():
+    assert naturals().foldr_lazy(
+        lambda x, rest: Done(x) if x > 10 else rest,
+        None,
+    ) == 11
+    # Short-circuiting deep in an infinite stream doesn't recurse
+    assert naturals().foldr_lazy(
+        lambda x, rest: Done(x) if x > 100000 else rest,
+        None,
+    ) == 100001
+    assert Stream(1, 2, 3).foldr_lazy(
+        lambda x, rest: rest.map(lambda acc: x + acc),
+        0,
+    ) == 6
+    assert Stream(1, 2, 3).foldr(lambda x, acc: [x] + acc, []) == [1, 2, 3]
+    assert naturals().take(100000).foldr(lambda x, acc: acc + 1, 0) == 100000
+    # Default implementation for other foldables
+    assert List(1, 2, 3, 4).foldr_lazy(
+        lambda x, rest: Done(x) if x % 2 == 0 else rest,
+        None,
+    ) == 2
+    return
+
+
+def test_stream_constant_memory():
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        total = 0
+        for x in naturals().map(lambda x: 2 * x).take(100000):
+            total += x
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert total == 100000 * 99999
+    # Without releasing the iterated cells, this would take megabytes
+    assert peak < 100000
+    return
+
+
+def benchmark_stream():
+
+    import timeit
+    import tracemalloc
+
+    def run(name, g, number=1):
+        tracemalloc.start()
+        g()
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        t = timeit.timeit(g, number=number) / number
+        print("{0:<32}{1:10.2f} ms{2:10.2f} MB".format(
+            name, 1e3 * t, peak / 1e6
+        ))
+        return
+
+    n = 1000000
+    print("{0} values: time, peak memory".format(n))
+    run(
+        "  List",
+        lambda: sum(List.from_iter(range(n)).map(lambda x: 2 * x)),
+    )
+    run(
+        "  Stream",
+        lambda: sum(naturals().map(lambda x: 2 * x).take(n)),
+    )
+    return
@@ -0,0 +1,107 @@
+from haskpy.types.trampoline import Trampoline, Done, Suspend
+from haskpy.types.maybe import MaybeT, Just, Nothing
+from haskpy.types.identity import IdentityT
+from haskpy.conftest import make_test_class
+
+
+# Test typeclass laws for Trampoline
+TestTrampoline = make_test_class(Trampoline)
+
+TestMaybeTTrampoline = make_test_class(MaybeT(Trampoline))
+
+TestIdentityTTrampoline = make_test_class(IdentityT(Trampoline))
+
+
+def test_trampoline_recursion():
+
+    def countdown(n):
+        return (
+            Done("done") if n == 0 else
+            Suspend(lambda: countdown(n - 1))
+        )
+
+    assert countdown(100000).run() == "done"
+
+    def is_even(n):
+        return Done(True) if n == 0 else Suspend(lambda: is_odd(n - 1))
+
+    def is_odd(n):
+        return Done(False) if n == 0 else Suspend(lambda: is_even(n - 1))
+
+    assert is_even(100001).run() is False
+    return
+
+
+def test_trampoline_bind():
+
+    # Left-nested chains of binds
+    m = Done(0)
+    for _ in range(100000):
+        m = m.bind(lambda x: Done(x + 1))
+    assert m.run() == 100000
+
+    # Right-nested chains of binds
+    def loop(n):
+        return Done(n).bind(lambda x: Done(x) if x == 0 else loop(x - 1))
+
+    assert loop(100000).run() == 0
+
+    # map is lazy for suspended computations
+    calls = []
+    m = Suspend(lambda: Done(1)).map(lambda x: calls.append(x) or x + 1)
+    assert calls == []
+    assert m.run() == 2
+    assert calls == [1]
+    return
+
+
+def test_trampoline_maybet():
+
+    # Monad transformers on top of Trampoline are stack-safe
+    M = MaybeT(Trampoline)
+    m = M.pure(0)
+    for _ in range(100000):
+        m = m.bind(lambda x: M.pure(x + 1))
+    assert m.decomposed.run() == Just(100000)
+
+    m = m.bind(lambda _: M(Done(Nothing)))
+    for _ in range(100000):
+        m = m.bind(lambda x: M.pure(x + 1))
+    assert m.decomposed.run() == Nothing
+    return
+
+
+def benchmark_trampoline():
+
+    import timeit
+
+    def run(name, g, n):
+        t = timeit.timeit(g, number=1)
+        print("{0:<24}{1:10.0f} binds/s".format(name, n / t))
+        return
+
+    def left(n):
+        m = Done(0)
+        for _ in range(n):
+            m = m.bind(lambda x: Done(x + 1))
+        return m.run()
+
+    def right(n):
+        def loop(k):
+            return Done(k).bind(lambda x: Done(x) if x == 0 else loop(x - 1))
+        return loop(n).run()
+
+    def maybet(n):
+        M = MaybeT(Trampoline)
+        m = M.pure(0)
+        for _ in range(n):
+            m = m.bind(lambda x: M.pure(x + 1))
+        return m.decomposed.run()
+
+    for n in [10 ** 5, 10 ** 6]:
+        print("{0} binds".format(n))
+        run("  left-nested", lambda: left(n), n)
+        run("  right-nested", lambda: right(n), n)
+        run("  MaybeT(Trampoline)", lambda: maybet(n), n)
+
+    return
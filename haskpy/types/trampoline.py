@@ -0,0 +1,116 @@
+"""Trampoline monad for stack-safe monadic computations
+
+Binding in monads such as Identity or Function calls the bound functions
+recursively, so long chains of binds (e.g., iterating a state machine) hit the
+recursion limit. Trampoline represents the computation as data instead: ``bind``
+just records the continuation and ``run`` evaluates the whole chain in a loop
+with constant stack depth.
+
+For instance, a loop can be written recursively:
+
+.. code-block:: python
+
+    def countdown(n):
+        return (
+            Done(n) if n == 0 else
+            Suspend(lambda: countdown(n - 1))
+        )
+
+    countdown(100000).run()
+
+Monad transformers can use Trampoline as the base monad to make them
+stack-safe, for instance, ``MaybeT(Trampoline)``.
+
+"""
+
+import attr
+
+from haskpy.typeclasses import Monad, Eq
+from haskpy.utils import immutable, class_function, eq_test, st
+
+
+class Trampoline(Monad, Eq):
+    """Stack-safe monad for deep chains of binds and recursion"""
+
+    __slots__ = ()
+
+    @class_function
+    def pure(cls, x):
+        return Done(x)
+
+    def bind(self, f):
+        """Trampoline a -> (a -> Trampoline b) -> Trampoline b"""
+        return _Bind(self, f)
+
+    def run(self):
+        """Trampoline a -> a
+
+        Evaluate the computation in a loop. The continuations of pending binds
+        are kept in a list instead of the call stack.
+
+        """
+        t = self
+        continuations = []
+        while True:
+            if isinstance(t, _Bind):
+                continuations.append(t.f)
+                t = t.trampoline
+            elif isinstance(t, Suspend):
+                t = t.thunk()
+            elif len(continuations) > 0:
+                t = continuations.pop()(t.x)
+            else:
+                return t.x
+
+    def __eq__(self, other):
+        """Trampoline a -> Trampoline a -> bool"""
+        return self.run() == other.run()
+
+    def __eq_test__(self, other, data):
+        return eq_test(self.run(), other.run(), data)
+
+    @class_function
+    def sample_value(cls, a):
+        return st.one_of(
+            a.map(Done),
+            a.map(lambda x: Suspend(lambda: Done(x))),
+            a.map(lambda x: Done(None).bind(lambda _: Done(x))),
+        )
+
+
+@immutable
+class Done(Trampoline):
+    """Finished computation with result ``x``"""
+
+    x = attr.ib()
+
+    def map(self, f):
+        return Done(f(self.x))
+
+    def __repr__(self):
+        return "Done({})".format(repr(self.x))
+
+
+@immutable
+class Suspend(Trampoline):
+    """Suspended computation that continues by calling ``thunk()``
+
+    The thunk takes no arguments and returns a Trampoline.
+
+    """
+
+    thunk = attr.ib()
+
+    def __repr__(self):
+        return "Suspend({})".format(repr(self.thunk))
+
+
+@immutable
+class _Bind(Trampoline):
+    """Computation ``trampoline`` followed by continuation ``f``"""
+
+    trampoline = attr.ib()
+    f = attr.ib()
+
+    def __repr__(self):
+        return "{0}.bind({1})".format(repr(self.trampoline), repr(self.f))
@@ -1,10 +1,53 @@
 import functools
+import importlib
 import inspect
+import itertools
 import attr
-import hypothesis.strategies as st
 
 
-def immutable(maybe_cls=None, eq=False, repr=False, **kwargs):
+__all__ = [
+    "FullArgSpec",
+    "PerformanceWarning",
+    "Wrapped",
+    "abstract_class_function",
+    "abstract_class_property",
+    "abstract_function",
+    "abstract_property",
+    "assert_output",
+    "class_function",
+    "class_property",
+    "count_required_arguments",
+    "curry",
+    "curry_checked",
+    "curry_compiled",
+    "decorator",
+    "draw_args",
+    "eq_test",
+    "getfullargspec",
+    "identity",
+    "immutable",
+    "lazy_import",
+    "nonexisting_function",
+    "reduce_balanced",
+    "sample_sized",
+    "sample_type",
+    "singleton",
+    "st",
+    "type_constructor",
+    "update_argspec",
+    "wraps",
+]
+
+
+def immutable(maybe_cls=None, eq=False, repr=False, slots=True, **kwargs):
+    """Frozen attrs class
+
+    By default, the attributes are stored in ``__slots__`` instead of a
+    per-instance ``__dict__``, which saves memory. For that to work, also all
+    the base classes must define ``__slots__`` (e.g., the typeclasses define
+    empty slots).
+
+    """
     return attr.s(
         maybe_cls=maybe_cls,
         frozen=True,
@@ -13,6 +56,7 @@ def immutable(maybe_cls=None, eq=False, repr=False, **kwargs):
         hash=False,
         str=False,
         repr=repr,
+        slots=slots,
         **kwargs
     )
 
@@ -21,6 +65,19 @@ def singleton(C):
     return C()
 
 
+def type_constructor(f):
+    """Cache the classes that a type constructor function creates
+
+    Applying the type constructor to the same arguments (e.g., classes) returns
+    the same class object instead of creating a new class, so, for instance,
+    ``Compose(List, Maybe)`` is the same type everywhere. The arguments must be
+    hashable. The cache can be inspected and cleared with the methods
+    ``cache_info`` and ``cache_clear`` of the returned function.
+
+    """
+    return functools.lru_cache(maxsize=None)(f)
+
+
 class decorator():
     """Base class for various decorators"""
 
@@ -128,10 +185,11 @@ class nonexisting_function():
     This is a workaround for Python forcefully creating some methods. One
     cannot create objects that don't have ``__eq__``, ``__ge__``, ``__gt__``
     and many other methods. They are there and it's not possible to delete
-    them. With this wrapper you can override those methods so that they won't
-    show up in ``__dir__`` listing and if accessed in any way,
-    ``AttributeError`` is raised. Note that it just hides the methods, one can
-    still access them as ``object.__getattribute__(obj, "__eq__")``.
+    them. With this wrapper you can override those methods so that calling
+    them in any way (e.g., ``x == y`` or ``hash(x)``) raises ``TypeError``.
+    ``haskpy.typeclasses.Type`` also hides them from its ``__dir__`` listing.
+    Note that the methods can still be accessed as attributes, because hiding
+    them from attribute access would slow down all attribute lookups.
 
     """
 
@@ -152,51 +210,201 @@ class nonexisting_function():
         return nonexisting_function(self.method, cls=objtype)
 
 
+class FullArgSpec(inspect.FullArgSpec):
+    """``inspect.FullArgSpec`` with the names of positional-only parameters
+
+    ``posonlyargs`` lists the positional-only parameters, which are always the
+    first ones in ``args``. It isn't a field of the tuple, so the argspec
+    still compares equal to the corresponding ``inspect.FullArgSpec``.
+
+    """
+
+    def __new__(cls, *args, posonlyargs=(), **kwargs):
+        spec = super().__new__(cls, *args, **kwargs)
+        spec.posonlyargs = tuple(posonlyargs)
+        return spec
+
+
 def update_argspec(spec, args, kwargs):
+    """Full argspec of ``functools.partial(f, *args, **kwargs)``
 
-    # TODO: Instead of running getfullargspec after every partial evaluation,
-    # it might be faster to use the existing argspec and update that based on
-    # args and kwargs. However, the speed gains might be quite small and one
-    # needs to be very careful to implement exactly the same logic that Python
-    # itself uses. It is possible that this logic changes from one Python
-    # version to another, so it might become a maintenance nightmare. Still,
-    # perhaps worth at least checking.
-    #
-    # Below is just some sketching.
+    Given the full argspec of ``f``, compute the full argspec of the partially
+    evaluated function without calling ``inspect.getfullargspec`` again. This
+    follows the logic that ``inspect`` uses for ``functools.partial`` objects:
+
+    - Positional arguments consume the positional parameters from the left.
+      Extra positional arguments go to ``*args`` if it exists.
+
+    - A positional parameter given as a keyword argument, and all the
+      positional parameters after it, become keyword-only. The given value
+      becomes the default value of the parameter.
+
+    - A keyword-only parameter given as a keyword argument gets the value as
+      its new default value.
+
+    - Unknown keyword arguments go to ``**kwargs`` if it exists. So do keyword
+      arguments with the name of a positional-only parameter, similarly as in
+      Python function calls.
+
+    ``TypeError`` is raised if the arguments cannot be bound to the
+    parameters. Positional-only parameters are read from ``posonlyargs`` of
+    the argspec (see ``FullArgSpec``). A plain ``inspect.FullArgSpec`` is
+    considered to have none.
+
+    """
 
-    no_varargs = spec.varargs is None
+    posonlyargs = getattr(spec, "posonlyargs", ())
 
     nargs_takes = len(spec.args)
     nargs_given = len(args)
-    nargs_remain = nargs_takes - nargs_given
-    if no_varargs and nargs_remain < 0:
+    if spec.varargs is None and nargs_given > nargs_takes:
         raise TypeError(
-            "function takes {takes} positional argument but {given} were given"
-            .format(
-                name=name,
-                takes=nargs_takes,
-                given=nargs_given,
-            )
+            "too many positional arguments: takes {takes} but {given} were "
+            "given".format(takes=nargs_takes, given=nargs_given)
         )
 
-    new_args = spec.args[nargs_given:]
-    new_defaults = spec.defaults[-nargs_remain:] if nargs_remain > 0 else None
+    consumed = spec.args[:nargs_given]
+    remaining = spec.args[nargs_given:]
+
+    for name in kwargs:
+        if name in posonlyargs:
+            if spec.varkw is None:
+                raise TypeError(
+                    "positional-only argument '{0}' passed as keyword "
+                    "argument".format(name)
+                )
+            # Goes to **kwargs
+            continue
+        if name in consumed:
+            raise TypeError("multiple values for argument '{0}'".format(name))
+        if (
+                spec.varkw is None and
+                name not in remaining and
+                name not in spec.kwonlyargs
+        ):
+            raise TypeError(
+                "got an unexpected keyword argument '{0}'".format(name)
+            )
+
+    # Default values of the positional parameters that haven't been consumed
+    ndefaults = 0 if spec.defaults is None else len(spec.defaults)
+    defaults = dict(
+        zip(spec.args[nargs_takes - ndefaults:], spec.defaults or ())
+    )
+
+    # The positional parameters before the first one given as a keyword
+    # argument remain positional
+    npositional = next(
+        (
+            i for (i, name) in enumerate(remaining)
+            if name in kwargs and name not in posonlyargs
+        ),
+        len(remaining),
+    )
+    new_args = remaining[:npositional]
+    new_defaults = tuple(
+        defaults[name] for name in new_args if name in defaults
+    )
+
+    # The rest become keyword-only parameters. Similarly as in inspect, they
+    # come before the original keyword-only parameters.
+    new_kwonlyargs = remaining[npositional:] + spec.kwonlyargs
+    new_kwonlydefaults = {
+        name: kwargs[name] if name in kwargs else defaults[name]
+        for name in remaining[npositional:]
+        if name in kwargs or name in defaults
+    }
+    new_kwonlydefaults.update(spec.kwonlydefaults or {})
+    new_kwonlydefaults.update(
+        (name, kwargs[name])
+        for name in spec.kwonlyargs
+        if name in kwargs
+    )
+
+    # Positional arguments can't be given to *args after some positional
+    # parameters have been moved to keyword-only parameters
+    new_varargs = spec.varargs if npositional == len(remaining) else None
 
-    # FIXME:
-    new_kwonlyargs = spec.kwonlyargs
-    new_kwonlydefaults = spec.kwonlydefaults
+    names = set(new_args).union(new_kwonlyargs, ["return"])
+    if new_varargs is not None:
+        names.add(new_varargs)
+    if spec.varkw is not None:
+        names.add(spec.varkw)
 
-    return inspect.FullArgSpec(
+    return FullArgSpec(
         args=new_args,
-        varargs=spec.varargs,
+        varargs=new_varargs,
         varkw=spec.varkw,
-        defaults=new_defaults,
+        defaults=new_defaults if len(new_defaults) > 0 else None,
         kwonlyargs=new_kwonlyargs,
-        kwonlydefaults=new_kwonlydefaults,
-        # FIXME: What to do with this?
-        annotations=spec.annotations,
+        kwonlydefaults=(
+            new_kwonlydefaults if len(new_kwonlydefaults) > 0 else None
+        ),
+        annotations={
+            name: annotation
+            for (name, annotation) in spec.annotations.items()
+            if name in names
+        },
+        # The positional-only parameters are the first ones, so the remaining
+        # ones are still first
+        posonlyargs=[name for name in posonlyargs if name in new_args],
+    )
+
+
+def getfullargspec(f):
+    """Full argspec of a callable based on ``inspect.signature``
+
+    Unlike ``inspect.getfullargspec``, this skips the bound first argument of
+    methods, classes and callable objects similarly as ``inspect.signature``
+    does. That is, the argspec describes how ``f`` itself can be called. Also,
+    the positional-only parameters are listed in ``posonlyargs``.
+
+    """
+    try:
+        signature = inspect.signature(f, follow_wrapped=False)
+    except ValueError as error:
+        raise TypeError("unsupported callable") from error
+
+    args = []
+    posonlyargs = []
+    varargs = None
+    varkw = None
+    defaults = []
+    kwonlyargs = []
+    kwonlydefaults = {}
+    annotations = {}
+
+    for p in signature.parameters.values():
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
+            args.append(p.name)
+            if p.kind is p.POSITIONAL_ONLY:
+                posonlyargs.append(p.name)
+            if p.default is not p.empty:
+                defaults.append(p.default)
+        elif p.kind is p.VAR_POSITIONAL:
+            varargs = p.name
+        elif p.kind is p.KEYWORD_ONLY:
+            kwonlyargs.append(p.name)
+            if p.default is not p.empty:
+                kwonlydefaults[p.name] = p.default
+        else:
+            varkw = p.name
+        if p.annotation is not p.empty:
+            annotations[p.name] = p.annotation
+
+    if signature.return_annotation is not signature.empty:
+        annotations["return"] = signature.return_annotation
+
+    return FullArgSpec(
+        args=args,
+        varargs=varargs,
+        varkw=varkw,
+        defaults=tuple(defaults) if len(defaults) > 0 else None,
+        kwonlyargs=kwonlyargs,
+        kwonlydefaults=kwonlydefaults if len(kwonlydefaults) > 0 else None,
+        annotations=annotations,
+        posonlyargs=posonlyargs,
     )
-    pass
 
 
 def count_required_arguments(argspec):
@@ -275,7 +483,7 @@ def wraps(f):
 
 
 
-def curry(f, wrap=True):
+def curry(f, wrap=True, argspec=None, compiled=False, checked=False):
     # toolz Python package has curry function but it's unusable. The main
     # problem being you don't get errors when doing something wrong but instead
     # some really weird results.
@@ -309,11 +517,34 @@ def curry(f, wrap=True):
     # purposes, currying is very simple as the implementation below shows.
     #
     # So, let's implement our own simple curry function correctly.
+    #
+    # ``argspec`` is the full argspec of the original function if it is
+    # already known. For a partially evaluated function, the original function
+    # is the one that the partial object wraps. If not given, the argspec is
+    # computed when needed for the first time. The argspecs of partially
+    # evaluated functions are found by updating the argspec of the original
+    # function, so inspect.getfullargspec is called at most once per curried
+    # function.
+    #
+    # If ``compiled`` is true and ``f`` takes only required positional
+    # arguments, a wrapper specialized for that arity is generated. See
+    # curry_compiled below.
+    #
+    # If ``checked`` is true, the given arguments are checked against the
+    # argspec before calling the function, so TypeErrors aren't used for
+    # detecting partial evaluations. See curry_checked below.
 
     if not callable(f):
         raise TypeError("'{}' object is not callable".format(type(f).__name__))
 
+    if compiled:
+        return curry_compiled(f, wrap=wrap)
+
+    if checked:
+        return curry_checked(f, wrap=wrap, argspec=argspec)
+
     def wrapped(*args, **kwargs):
+        nonlocal argspec
 
         try:
             # Handle a normal fully evaluated function fast. We want to get
@@ -321,20 +552,19 @@ def curry(f, wrap=True):
             # compared to just evaluating a function.
             return f(*args, **kwargs)
         except TypeError:
+            # Partial objects are flattened, so fp.func is the same original
+            # function for all partial evaluations of f and fp.args and
+            # fp.keywords contain all the arguments given so far.
             fp = functools.partial(f, *args, **kwargs)
             try:
-                # This is quite slow.. It's about 1000x slower than just
-                # normally calling a function. See:
-                # https://bugs.python.org/issue37010. Any way to speed it up,
-                # do something else or avoid it?
-                #
-                # TODO: Perhaps worth considering if it would speed things up
-                # if the full argspec is propagated recursively to curry for
-                # partially evaluated functions. That way, they can just update
-                # the existing argspec based on args and kwargs instead of
-                # finding it from scratch. See update_argspec above. Then,
-                # curry function would take argspec as an optional argument.
-                spec = inspect.getfullargspec(fp)
+                # Finding the argspec is quite slow.. It's about 1000x slower
+                # than just normally calling a function. See:
+                # https://bugs.python.org/issue37010. Thus, find it only once
+                # for the original function and then just update it based on
+                # the given arguments.
+                if argspec is None:
+                    argspec = getfullargspec(fp.func)
+                new_argspec = update_argspec(argspec, fp.args, fp.keywords)
             except TypeError:
                 # This exception is raised when invalid arguments (positional
                 # or keyword) are passed. To make the exception traceback
@@ -350,8 +580,8 @@ def curry(f, wrap=True):
                 # 1. The function is still waiting for some required inputs.
                 #    In that case, don't raise the error, just partially
                 #    evaluate the function (and curry it).
-                if count_required_arguments(spec) > 0:
-                    return curry(fp, wrap=wrap)
+                if count_required_arguments(new_argspec) > 0:
+                    return curry(fp, wrap=wrap, argspec=argspec)
                 # 2. The function received all required arguments, thus the
                 #    error must have happened somewhere inside the
                 #    function. In that case, just raise the original error.
@@ -369,62 +599,189 @@ def curry(f, wrap=True):
     return wraps(f)(wrapped) if wrap else wrapped
 
 
-def curry_new(f, argspec=None):
-    """Experimental fast curry that updates argspec"""
+def curry_checked(f, wrap=True, argspec=None):
+    """Curry a function by checking the arguments before calling it
+
+    The generic ``curry`` calls the function and, if ``TypeError`` is raised,
+    finds out whether the function just didn't get all the required arguments.
+    That's slow because of the exception handling, and ambiguous if the
+    function raises ``TypeError`` itself. Instead, this finds the argspec once
+    and checks the given arguments against it before calling the function:
+
+    - If only positional arguments are given and they cover all the required
+      arguments, the function is called directly.
+
+    - Otherwise, the argspec is updated with the given arguments. Invalid
+      arguments raise ``TypeError``. If some required arguments are still
+      missing, a partially evaluated curried function is returned without
+      calling the function.
+
+    Thus, partial evaluations never raise exceptions and ``TypeError`` raised
+    inside the function is just propagated.
+
+    ``argspec`` is the full argspec of the original function similarly as in
+    ``curry``.
+
+    """
 
     if not callable(f):
         raise TypeError("'{}' object is not callable".format(type(f).__name__))
 
-    # NOTE: functools.wraps is a bit slow. Thus, currying functions all the
-    # time might be a bit slow. Without wrapping, curry takes about 0.3
-    # microseconds. With functools.wraps, 3 microseconds. With my own simple
-    # wraps method, it takes 1 microsecond. Let's use that for now. Not sure if
-    # it misses something. If so, use functools.wraps.
+    # Partial objects are flattened, so this gives the original function and
+    # the arguments given so far
+    fp = functools.partial(f)
+    if argspec is None:
+        argspec = getfullargspec(fp.func)
+    return _curry_checked(
+        f,
+        argspec,
+        update_argspec(argspec, fp.args, fp.keywords),
+        wrap,
+    )
+
+
+def _curry_checked(f, argspec, spec, wrap):
+
+    # Cache the number of required arguments so that the usual case of giving
+    # enough positional arguments can be checked fast
+    nargs_required = len(spec.args) - (
+        0 if spec.defaults is None else
+        len(spec.defaults)
+    )
+    nkw_required = count_required_arguments(spec) - nargs_required
 
-    @wraps(f)
     def wrapped(*args, **kwargs):
-        nonlocal argspec
+        if not kwargs and nkw_required == 0 and len(args) >= nargs_required:
+            # If there are too many positional arguments, the function itself
+            # raises an error.
+            return f(*args)
+        fp = functools.partial(f, *args, **kwargs)
+        new_spec = update_argspec(argspec, fp.args, fp.keywords)
+        if count_required_arguments(new_spec) > 0:
+            return _curry_checked(fp, argspec, new_spec, wrap)
+        return f(*args, **kwargs)
 
-        try:
-            # Handle a normal fully evaluated function fast. We want to get
-            # full argspec only if necessary as that takes quite a bit of time
-            # compared to just evaluating a function.
-            return f(*args, **kwargs)
-        except TypeError:
-            if argspec is None:
-                argspec = inspect.getfullargspec(f)
-            try:
-                new_argspec = update_argspec("foo", argspec, args, kwargs)
-            except TypeError:
-                # This exception is raised when invalid arguments (positional
-                # or keyword) are passed. To make the exception traceback
-                # simpler, raise the original TypeError. Also, raise it outside
-                # this try-except so these exceptions won't show up in the
-                # traceback.
-                pass
-            else:
-                # The original function raised TypeError but there's
-                # nothing wrong in how the call signature was used. There
-                # are now two possibilities:
-                #
-                # 1. The function is still waiting for some required inputs.
-                #    In that case, don't raise the error, just partially
-                #    evaluate the function (and curry it).
-                if count_required_arguments(new_argspec) > 0:
-                    return curry_new(
-                        functools.partial(f, *args, **kwargs),
-                        argspec=new_argspec
-                    )
-                # 2. The function received all required arguments, thus the
-                #    error must have happened somewhere inside the
-                #    function. In that case, just raise the original error.
-                pass
+    return wraps(f)(wrapped) if wrap else wrapped
 
-            # The function either got invalid arguments or raised TypeError
-            # somewhere inside its computations. Just raise that error.
-            raise
 
-    return wrapped
+# Sentinel for positional arguments that haven't been given to a compiled
+# curried function
+_missing = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_positional(n):
+    """Generate a factory for curried wrappers of n-ary positional functions
+
+    For instance, for n=2 the wrapper is:
+
+    .. code-block:: python
+
+        def curried(x0=_missing, x1=_missing, /, *rest, **kwargs):
+            if x1 is not _missing and not kwargs:
+                return f(x0, x1, *rest)
+            return partial((x0, x1), rest, kwargs)
+
+    So, when all the arguments are given, the function is called directly
+    without packing the arguments or catching any exceptions. If there are too
+    many arguments, the function itself raises the error.
+
+    """
+    params = ", ".join("x{0}=_missing".format(i) for i in range(n))
+    args = ", ".join("x{0}".format(i) for i in range(n))
+    source = (
+        "def factory(f, partial, _missing):\n"
+        "    def curried({params}, /, *rest, **kwargs):\n"
+        "        if x{last} is not _missing and not kwargs:\n"
+        "            return f({args}, *rest)\n"
+        "        return partial(({args},), rest, kwargs)\n"
+        "    return curried\n"
+    ).format(params=params, args=args, last=n - 1)
+    namespace = {}
+    exec(source, namespace)
+    return namespace["factory"]
+
+
+def curry_compiled(f, wrap=True):
+    """Curry a function by generating a wrapper specialized for its arity
+
+    The signature of ``f`` is inspected only once. If ``f`` takes only
+    required positional arguments (no defaults, ``*args``, keyword-only
+    arguments nor ``**kwargs``), the curried function dispatches on the number
+    of given arguments without trying to call ``f`` and catching
+    ``TypeError``. Partially evaluated functions are compiled similarly.
+    Keyword arguments are handled by the generic ``curry``.
+
+    For other signatures, this falls back to the generic ``curry``.
+
+    """
+
+    if not callable(f):
+        raise TypeError("'{}' object is not callable".format(type(f).__name__))
+
+    try:
+        signature = inspect.signature(f)
+    except (TypeError, ValueError):
+        return curry(f, wrap=wrap)
+
+    parameters = tuple(signature.parameters.values())
+    positional = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    if len(parameters) == 0 or any(
+            p.kind not in positional or p.default is not p.empty
+            for p in parameters
+    ):
+        return curry(f, wrap=wrap)
+
+    return _curry_positional(f, signature, f if wrap else None)
+
+
+def _curry_positional(f, signature, original):
+
+    generic = None
+
+    def partial(args, rest, kwargs):
+        nonlocal generic
+        # The given positional arguments are the ones before the first missing
+        # argument
+        given = tuple(itertools.takewhile(lambda x: x is not _missing, args))
+        if kwargs:
+            # Leave keyword arguments for the generic curry
+            if generic is None:
+                generic = curry(f, wrap=False)
+            return generic(*given, *rest, **kwargs)
+        if len(given) == 0:
+            return curried
+        return _curry_positional(
+            functools.partial(f, *given),
+            signature.replace(
+                parameters=tuple(signature.parameters.values())[len(given):]
+            ),
+            original,
+        )
+
+    curried = _compile_positional(len(signature.parameters))(
+        f,
+        partial,
+        _missing,
+    )
+
+    if original is not None:
+        # Set the attributes directly instead of using Wrapped so that there's
+        # no extra layer of function calls.
+        curried.__signature__ = signature
+        curried.__doc__ = getattr(original, "__doc__", None)
+        curried.__module__ = getattr(original, "__module__", None)
+        curried.__name__ = getattr(original, "__name__", curried.__name__)
+        curried.__qualname__ = getattr(
+            original,
+            "__qualname__",
+            curried.__qualname__,
+        )
+
+    return curried
 
 
 def identity(x):
@@ -432,16 +789,133 @@ def identity(x):
     return x
 
 
+def reduce_balanced(combine, xs, empty):
+    """Reduce values by combining adjacent ones in a balanced tree
+
+    ``combine`` must be associative and ``empty`` its identity, which is
+    returned only if ``xs`` is empty. The values are combined in pairs, then
+    the pairs in pairs and so on, keeping the order of the values. For values
+    whose combining copies them (e.g., strings and lists), this takes
+    O(n log n) time instead of O(n^2) of a left fold. Similarly, nested
+    structures (e.g., compositions) are only O(log n) deep.
+
+    The values are consumed lazily: only the partial results of at most
+    O(log n) subtrees are kept at a time.
+
+    """
+    # Stack of partial results and the number of values in them. The numbers
+    # are decreasing powers of two similarly as the bits of a binary counter.
+    stack = []
+    for x in xs:
+        n = 1
+        while len(stack) > 0 and stack[-1][1] == n:
+            (y, m) = stack.pop()
+            x = combine(y, x)
+            n += m
+        stack.append((x, n))
+    if len(stack) == 0:
+        return empty
+    (x, _) = stack.pop()
+    while len(stack) > 0:
+        (y, _) = stack.pop()
+        x = combine(y, x)
+    return x
+
+
 class PerformanceWarning(Warning):
     pass
 
 
-@st.composite
+@immutable
+class lazy_import():
+    """Module that is imported when one of its functions is called
+
+    Accessing an attribute returns a function that imports the module and
+    calls the corresponding function of the module. So the functions can be
+    referenced at import time (e.g., ``given(st.data)``) without importing the
+    module. This is used for Hypothesis, so that HaskPy can be imported
+    quickly and without Hypothesis installed although the property tests and
+    sampling strategies are defined in the classes.
+
+    """
+
+    name = attr.ib()
+
+    def __getattr__(self, function_name):
+        if function_name.startswith("__"):
+            raise AttributeError(function_name)
+
+        def f(*args, **kwargs):
+            module = importlib.import_module(self.name)
+            return getattr(module, function_name)(*args, **kwargs)
+
+        f.__name__ = function_name
+        return f
+
+
+st = lazy_import("hypothesis.strategies")
+
+
+def given(*strategies):
+    """Lazy ``hypothesis.given`` for property tests defined at import time
+
+    The arguments are functions that return the strategies (e.g.,
+    ``st.data``). Hypothesis is imported and the test is wrapped with
+    ``hypothesis.given`` when the test is called for the first time.
+
+    """
+
+    def decorate(f):
+
+        test = None
+
+        @functools.wraps(f)
+        def wrapped(*args, **kwargs):
+            nonlocal test
+            if test is None:
+                from hypothesis import given
+                test = given(*(s() for s in strategies))(f)
+            return test(*args, **kwargs)
+
+        # The strategies fill the last parameters, so hide them from the
+        # signature similarly as hypothesis.given does. Otherwise, pytest would
+        # look for fixtures with those names.
+        signature = inspect.signature(f)
+        parameters = tuple(signature.parameters.values())
+        wrapped.__signature__ = signature.replace(
+            parameters=parameters[:len(parameters) - len(strategies)]
+        )
+        return wrapped
+
+    return decorate
+
+
+def composite(f):
+    """Lazy ``hypothesis.strategies.composite``
+
+    Hypothesis is imported when the strategy is created for the first time.
+
+    """
+
+    strategy = None
+
+    @functools.wraps(f)
+    def wrapped(*args, **kwargs):
+        nonlocal strategy
+        if strategy is None:
+            from hypothesis.strategies import composite
+            strategy = composite(f)
+        return strategy(*args, **kwargs)
+
+    return wrapped
+
+
+@composite
 def draw_args(draw, f, *args):
     return f(*(draw(a) for a in args))
 
 
-@st.composite
+@composite
 def sample_type(draw, types, types1=[], types2=[]):
     if len(types) == 0:
         raise ValueError("Must provide at least one concrete type")